@@ -0,0 +1,80 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares wall-clock time and peak memory of the master table joins.
+
+Run from the project root with
+``PYTHONPATH=src python benchmarks/bench_master_table.py``.
+The raw data in ``data/01_raw`` is preprocessed and then joined by each
+``create_master_table`` join method.
+"""
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+from kedro_tutorial.pipelines.data_engineering.nodes import (
+    create_master_table,
+    preprocess_companies,
+    preprocess_shuttles,
+)
+
+RAW_PATH = Path("data") / "01_raw"
+
+
+def main():
+    companies = preprocess_companies(pd.read_csv(RAW_PATH / "companies.csv"))
+    reviews = pd.read_csv(RAW_PATH / "reviews.csv")
+    shuttles = preprocess_shuttles(pd.read_excel(RAW_PATH / "shuttles.xlsx"))
+
+    results = {}
+    for join_method in ["merge", "hash"]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        master_table = create_master_table(shuttles, companies, reviews, join_method)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[join_method] = master_table
+        print(
+            f"{join_method}: {elapsed:.3f}s, peak {peak / 2 ** 20:.1f} MiB, "
+            f"{len(master_table):,} rows"
+        )
+
+    expected, actual = (
+        results[join_method].sort_values(list(results[join_method].columns))
+        for join_method in ["merge", "hash"]
+    )
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+
+
+if __name__ == "__main__":
+    main()
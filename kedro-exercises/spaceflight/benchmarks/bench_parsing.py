@@ -0,0 +1,83 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares the vectorised parsers against the original per-row functions.
+
+Run from the project root with ``PYTHONPATH=src python benchmarks/bench_parsing.py``.
+``companies.csv`` is read from ``data/01_raw`` and scaled up 100x.
+"""
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from kedro_tutorial.pipelines.data_engineering.parsing import is_true, parse_percentage
+
+RAW_PATH = Path("data") / "01_raw"
+SCALE = 100
+REPEAT = 3
+
+
+def _is_true(x):
+    return x == "t"
+
+
+def _parse_percentage(x):
+    if isinstance(x, str):
+        return float(x.replace("%", "")) / 100
+    return float("NaN")
+
+
+def _best_of(func) -> float:
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def main():
+    companies = pd.read_csv(RAW_PATH / "companies.csv")
+    companies = pd.concat([companies] * SCALE, ignore_index=True)
+    print(f"companies: {len(companies):,} rows")
+
+    for column, per_row, vectorised in [
+        ("iata_approved", _is_true, is_true),
+        ("company_rating", _parse_percentage, parse_percentage),
+    ]:
+        series = companies[column]
+        expected = series.apply(per_row)
+        actual = vectorised(series)
+        np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy())
+
+        apply_time = _best_of(lambda: series.apply(per_row))
+        vectorised_time = _best_of(lambda: vectorised(series))
+        print(
+            f"{column}: apply {apply_time:.3f}s, vectorised {vectorised_time:.3f}s "
+            f"({apply_time / vectorised_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -58,10 +58,16 @@ TO_NODES_HELP = """A list of node names which should be used as an end point."""
 NODE_ARG_HELP = """Run only nodes with specified names."""
 RUNNER_ARG_HELP = """Specify a runner that you want to run the pipeline with.
 Available runners: `SequentialRunner`, `ParallelRunner` and `ThreadRunner`.
+Use `kedro_tutorial.runner.FingerprintRunner` to skip the nodes whose outputs
+are up to date.
 This option cannot be used together with --parallel."""
 PARALLEL_ARG_HELP = """Run the pipeline using the `ParallelRunner`.
 If not specified, use the `SequentialRunner`. This flag cannot be used together
 with --runner."""
+ASYNC_ARG_HELP = """Load and save the node inputs and outputs asynchronously
+with threads. With `kedro_tutorial.runner.PrefetchRunner` or `FingerprintRunner`,
+the inputs of the next nodes are prefetched and the outputs are saved in the
+background while nodes run."""
 TAG_ARG_HELP = """Construct the pipeline using only nodes which have this tag
 attached. Option can be used multiple times, what results in a
 pipeline constructed from nodes having any of those tags."""
@@ -169,6 +175,7 @@ def cli():
     "--runner", "-r", type=str, default=None, multiple=False, help=RUNNER_ARG_HELP
 )
 @click.option("--parallel", "-p", is_flag=True, multiple=False, help=PARALLEL_ARG_HELP)
+@click.option("--async", "is_async", is_flag=True, multiple=False, help=ASYNC_ARG_HELP)
 @env_option
 @click.option("--tag", "-t", type=str, multiple=True, help=TAG_ARG_HELP)
 @click.option(
@@ -195,6 +202,7 @@ def run(
     env,
     parallel,
     runner,
+    is_async,
     node_names,
     to_nodes,
     from_nodes,
@@ -221,7 +229,7 @@ def run(
     context = load_context(Path.cwd(), env=env, extra_params=params)
     context.run(
         tags=tag,
-        runner=runner_class(),
+        runner=runner_class(is_async=is_async),
         node_names=node_names,
         from_nodes=from_nodes,
         to_nodes=to_nodes,
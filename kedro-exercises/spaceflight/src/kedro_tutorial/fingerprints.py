@@ -0,0 +1,270 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Fingerprints of nodes, used to skip the nodes whose outputs are up to date.
+
+The fingerprint of a node hashes the source of its function, the values of
+its parameters and the fingerprints of its other inputs.  An input produced
+by another node of the pipeline being run takes that node's fingerprint,
+so fingerprints are known before any node runs; any other input takes the
+SHA-256 hash of its files, cached by size and modification time.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+
+FINGERPRINTS_FILEPATH = "data/node_fingerprints.json"
+
+
+def _sha256(filepath: Path) -> str:
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _hash(*parts: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=repr).encode()
+    ).hexdigest()
+
+
+def _strip_transcoding(data_set_name: str) -> str:
+    return data_set_name.split("@")[0]
+
+
+def _module_files(func: Callable) -> Set[str]:
+    """Source files of the module defining ``func`` and of the modules of
+    the same package it depends on, so that a change to a helper function
+    also changes the fingerprint of the node calling it.
+    """
+    while isinstance(func, functools.partial):
+        func = func.func
+    package = func.__module__.split(".")[0]
+    pending = [sys.modules[func.__module__]]
+    seen = set()  # type: Set[str]
+    while pending:
+        module = pending.pop()
+        if module.__name__ in seen or not hasattr(module, "__file__"):
+            continue
+        seen.add(module.__name__)
+        for value in vars(module).values():
+            name = (
+                value.__name__
+                if isinstance(value, ModuleType)
+                else getattr(value, "__module__", None)
+            )
+            if name in sys.modules and name.split(".")[0] == package:
+                pending.append(sys.modules[name])
+    return {sys.modules[name].__file__ for name in seen}
+
+
+def _function_fingerprint(func: Callable) -> str:
+    arguments = []
+    while isinstance(func, functools.partial):
+        arguments.append((func.args, func.keywords))
+        func = func.func
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = f"{func.__module__}.{func.__qualname__}"
+    modules = sorted((file, _sha256(Path(file))) for file in _module_files(func))
+    return _hash(source, arguments, modules)
+
+
+class NodeFingerprints:
+    """Compute the fingerprints of the nodes of a pipeline and keep those of
+    the nodes that last ran successfully in a JSON file.
+    """
+
+    def __init__(self, filepath: str = FINGERPRINTS_FILEPATH) -> None:
+        self._filepath = filepath
+        self._nodes = {}  # type: Dict[str, str]
+        self._files = {}  # type: Dict[str, List[Any]]
+        if os.path.isfile(filepath):
+            with open(filepath) as file:
+                stored = json.load(file)
+            self._nodes = stored["nodes"]
+            self._files = stored["files"]
+
+    def _file_fingerprint(self, filepath: Path) -> str:
+        stat = filepath.stat()
+        cached = self._files.get(str(filepath))
+        if cached is not None and cached[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return cached[2]
+        digest = _sha256(filepath)
+        self._files[str(filepath)] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def _data_set_fingerprint(
+        self, catalog: DataCatalog, data_set_name: str
+    ) -> Optional[str]:
+        if data_set_name == "parameters" or data_set_name.startswith("params:"):
+            return _hash(catalog.load(data_set_name))
+
+        # pylint: disable=protected-access
+        data_set = catalog._data_sets.get(data_set_name)
+        description = data_set._describe() if data_set is not None else {}
+        path = description.get("filepath") or description.get("path")
+        if path is None or not Path(str(path)).exists():
+            return None
+        path = Path(str(path))
+        files = sorted(path.rglob("*")) if path.is_dir() else [path]
+        return _hash(
+            description,
+            [
+                (str(file), self._file_fingerprint(file))
+                for file in files
+                if file.is_file()
+            ],
+        )
+
+    def compute(
+        self, pipeline: Pipeline, catalog: DataCatalog
+    ) -> Dict[str, Optional[str]]:
+        """Computes the fingerprints of the nodes of ``pipeline``.
+
+        Args:
+            pipeline: The pipeline to compute the node fingerprints of.
+            catalog: The catalog the pipeline is run with.
+
+        Returns:
+            A mapping from node name to fingerprint, or to ``None`` if the
+            node depends on an input that cannot be fingerprinted.
+
+        """
+        fingerprints = {}  # type: Dict[str, Optional[str]]
+        producers = {
+            _strip_transcoding(output): node
+            for node in pipeline.nodes
+            for output in node.outputs
+        }
+        for node in pipeline.nodes:
+            inputs = []
+            for data_set_name in node.inputs:
+                producer = producers.get(_strip_transcoding(data_set_name))
+                if producer is not None:
+                    inputs.append(fingerprints[producer.name])
+                else:
+                    inputs.append(self._data_set_fingerprint(catalog, data_set_name))
+            fingerprints[node.name] = (
+                _hash(
+                    # pylint: disable=protected-access
+                    _function_fingerprint(node._func),
+                    node.inputs,
+                    node.outputs,
+                    inputs,
+                )
+                if None not in inputs
+                else None
+            )
+        return fingerprints
+
+    def up_to_date(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        fingerprints: Optional[Dict[str, Optional[str]]] = None,
+    ) -> List[Node]:
+        """Finds the nodes of ``pipeline`` that need not run: nodes whose
+        fingerprint matches the one of their last successful run, and whose
+        outputs are either saved in the catalog or only used by other nodes
+        that need not run.
+
+        Args:
+            pipeline: The pipeline to find the up-to-date nodes of.
+            catalog: The catalog the pipeline is run with.
+            fingerprints: The node fingerprints, as returned by ``compute``.
+                Computed if not given.
+
+        Returns:
+            The up-to-date nodes.
+
+        """
+        if fingerprints is None:
+            fingerprints = self.compute(pipeline, catalog)
+        consumers = {}  # type: Dict[str, List[Node]]
+        for node in pipeline.nodes:
+            for data_set_name in node.inputs:
+                consumers.setdefault(_strip_transcoding(data_set_name), []).append(node)
+
+        # outputs without a catalog entry are never saved between runs
+        registered = set(catalog.list())
+        saved = {
+            output
+            for output in pipeline.all_outputs()
+            if output in registered and catalog.exists(output)
+        }
+        up_to_date = set()  # type: Set[Node]
+        for node in reversed(pipeline.nodes):
+            fingerprint = fingerprints[node.name]
+            if fingerprint is None or self._nodes.get(node.name) != fingerprint:
+                continue
+            if all(
+                output in saved
+                or (
+                    consumers.get(_strip_transcoding(output))
+                    and set(consumers[_strip_transcoding(output)]) <= up_to_date
+                )
+                for output in node.outputs
+            ):
+                up_to_date.add(node)
+        return [node for node in pipeline.nodes if node in up_to_date]
+
+    def record(self, fingerprints: Dict[str, Optional[str]], nodes: Iterable[str]):
+        """Records the fingerprints of the nodes that ran successfully.
+
+        Args:
+            fingerprints: The node fingerprints, as computed before the run.
+            nodes: The names of the nodes that ran successfully.
+
+        """
+        for name in nodes:
+            if fingerprints.get(name) is not None:
+                self._nodes[name] = fingerprints[name]
+        self.save()
+
+    def save(self) -> None:
+        """Saves the recorded node fingerprints and the file hashes computed
+        so far, so that unchanged files are not hashed again.
+        """
+        Path(self._filepath).parent.mkdir(parents=True, exist_ok=True)
+        temporary_filepath = f"{self._filepath}.tmp"
+        with open(temporary_filepath, "w") as file:
+            json.dump({"nodes": self._nodes, "files": self._files}, file)
+        os.replace(temporary_filepath, self._filepath)
@@ -37,6 +37,7 @@ from kedro.versioning import Journal
 
 from kedro_tutorial.pipelines import data_engineering as de
 from kedro_tutorial.pipelines import data_science as ds
+from kedro_tutorial.pipelines import inference
 
 
 class ProjectHooks:
@@ -54,7 +55,13 @@ class ProjectHooks:
         return {
             "__default__": data_engineering_pipeline + data_science_pipeline,
             "de": data_engineering_pipeline,
+            "de_streaming": de.create_streaming_pipeline(),
+            "de_out_of_core": de.create_out_of_core_pipeline(),
+            "de_incremental": de.create_incremental_pipeline(),
             "ds": data_science_pipeline,
+            "ds_sweep": ds.create_sweep_pipeline(),
+            "ds_cv": ds.create_cross_validation_pipeline(),
+            "inference": inference.create_pipeline(),
         }
 
     @hook_impl
@@ -74,5 +81,17 @@ class ProjectHooks:
             catalog, credentials, load_versions, save_version, journal
         )
 
+    @hook_impl
+    def after_pipeline_run(self, pipeline: Pipeline, catalog: DataCatalog) -> None:
+        """Confirm the incremental inputs of a successful run, so that the
+        next run only loads what has been added since.
+        """
+        for data_set_name in pipeline.inputs():
+            # pylint: disable=protected-access
+            data_set = catalog._data_sets.get(data_set_name)
+            confirm = getattr(data_set, "confirm", None)
+            if callable(confirm):
+                confirm()
+
 
 project_hooks = ProjectHooks()
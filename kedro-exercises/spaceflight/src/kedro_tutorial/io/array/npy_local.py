@@ -0,0 +1,97 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""``NpyLocalDataSet`` saves NumPy arrays to local ``.npy`` files and loads
+them memory-mapped.
+"""
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+from kedro.io import AbstractDataSet
+
+__all__ = ["NpyLocalDataSet"]
+
+
+class NpyLocalDataSet(AbstractDataSet):
+    """``NpyLocalDataSet`` loads and saves a NumPy array to a local ``.npy``
+    file.  By default, the array is loaded as a read-only memory map of the
+    file, so its rows are only read from disk when they are used, and other
+    processes can map the same rows instead of receiving a copy of them.
+
+    Example:
+    ::
+
+        >>> import numpy as np
+        >>>
+        >>> data = np.arange(12.0).reshape(4, 3)
+        >>> data_set = NpyLocalDataSet(filepath="X_train.npy")
+        >>> data_set.save(data)
+        >>> reloaded = data_set.load()
+        >>>
+        >>> assert np.array_equal(data, reloaded)
+
+    """
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(filepath=self._filepath, load_args=self._load_args)
+
+    def __init__(
+        self, filepath: str, load_args: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Creates a new instance of ``NpyLocalDataSet``.
+
+        Args:
+            filepath: Path to the ``.npy`` file.
+            load_args: Provided to underlying ``numpy.load`` function.
+                ``mmap_mode`` defaults to ``"r"``; set it to ``None`` to read
+                the whole array into memory instead.
+
+        """
+        default_load_args = {"mmap_mode": "r"}
+        self._filepath = filepath
+        self._load_args = (
+            {**default_load_args, **load_args}
+            if load_args is not None
+            else default_load_args
+        )
+
+    def _load(self) -> np.ndarray:
+        return np.load(self._filepath, **self._load_args)
+
+    def _save(self, data: np.ndarray) -> None:
+        filepath = Path(self._filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        # Arrays mapped from the previous file stay valid while it is replaced.
+        temporary_filepath = f"{filepath}.{os.getpid()}.tmp"
+        with open(temporary_filepath, "wb") as file:
+            np.save(file, np.ascontiguousarray(data), allow_pickle=False)
+        os.replace(temporary_filepath, filepath)
+
+    def _exists(self) -> bool:
+        return Path(self._filepath).is_file()
@@ -0,0 +1,357 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Datasets that load and save local files as iterators of ``DataFrame`` chunks."""
+from functools import partial
+from itertools import islice
+from os.path import isfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import openpyxl
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataSet, DataSetError
+
+__all__ = [
+    "ChunkedCSVLocalDataSet",
+    "ChunkedExcelLocalDataSet",
+    "ChunkedParquetLocalDataSet",
+    "PartitionedCSVLocalDataSet",
+]
+
+
+class ChunkedCSVLocalDataSet(AbstractDataSet):
+    """Load and save a local CSV file as an iterator of ``DataFrame`` chunks.
+
+    Loading returns the iterator of ``pandas.read_csv`` with ``chunksize``
+    set, and saving writes each chunk of an iterable as soon as it is
+    produced, so only one chunk is held in memory at a time.
+
+    Example:
+    ::
+
+        >>> import pandas as pd
+        >>>
+        >>> data = pd.DataFrame({"a": range(10), "b": range(10)})
+        >>> data_set = ChunkedCSVLocalDataSet("test.csv", chunksize=4)
+        >>>
+        >>> data_set.save(data[i : i + 4] for i in range(0, 10, 4))
+        >>> reloaded = pd.concat(data_set.load(), ignore_index=True)
+        >>>
+        >>> assert data.equals(reloaded)
+
+    """
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            chunksize=self._chunksize,
+            load_args=self._load_args,
+            save_args=self._save_args,
+        )
+
+    def __init__(
+        self,
+        filepath: str,
+        chunksize: int = 100_000,
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Creates a new ``ChunkedCSVLocalDataSet``.
+
+        Args:
+            filepath: Path to a local CSV file.
+            chunksize: Number of rows in each loaded chunk.
+            load_args: Provided to underlying ``pandas.read_csv``
+                function.  All defaults are preserved.
+            save_args: Provided to underlying ``pandas.DataFrame.to_csv``
+                function.  All defaults are preserved, but ``index``,
+                which is set to ``False``.
+
+        """
+        default_save_args = {"index": False}
+        self._filepath = filepath
+        self._chunksize = chunksize
+        self._load_args = load_args or {}
+        self._save_args = (
+            {**default_save_args, **save_args}
+            if save_args is not None
+            else default_save_args
+        )
+
+    def _load(self) -> Iterator[pd.DataFrame]:
+        return pd.read_csv(self._filepath, chunksize=self._chunksize, **self._load_args)
+
+    def _save(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
+        if isinstance(data, pd.DataFrame):
+            data = [data]
+
+        save_args = self._save_args.copy()
+        header = save_args.pop("header", True)
+        with open(self._filepath, "w", newline="") as file:
+            for chunk in data:
+                chunk.to_csv(file, header=header, **save_args)
+                header = False
+
+    def _exists(self) -> bool:
+        return isfile(self._filepath)
+
+
+class ChunkedExcelLocalDataSet(AbstractDataSet):
+    """Load a local Excel worksheet as an iterator of ``DataFrame`` chunks.
+
+    The workbook is opened in ``openpyxl`` read-only mode, so rows are
+    parsed lazily and only one chunk is held in memory at a time.  The first
+    row of the worksheet is used as the header.  Saving is not supported.
+
+    Example:
+    ::
+
+        >>> data_set = ChunkedExcelLocalDataSet("shuttles.xlsx", chunksize=1000)
+        >>> for chunk in data_set.load():
+        >>>     print(chunk.shape)
+
+    """
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            chunksize=self._chunksize,
+            sheet_name=self._sheet_name,
+        )
+
+    def __init__(
+        self, filepath: str, chunksize: int = 100_000, sheet_name: Optional[str] = None
+    ) -> None:
+        """Creates a new ``ChunkedExcelLocalDataSet``.
+
+        Args:
+            filepath: Path to a local ``.xlsx`` file.
+            chunksize: Number of rows in each loaded chunk.
+            sheet_name: Worksheet to read.  Defaults to the first worksheet.
+
+        """
+        self._filepath = filepath
+        self._chunksize = chunksize
+        self._sheet_name = sheet_name
+
+    def _load(self) -> Iterator[pd.DataFrame]:
+        workbook = openpyxl.load_workbook(
+            self._filepath, read_only=True, data_only=True
+        )
+        try:
+            worksheet = (
+                workbook[self._sheet_name]
+                if self._sheet_name is not None
+                else workbook.worksheets[0]
+            )
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(rows)
+            while True:
+                records = list(islice(rows, self._chunksize))
+                if not records:
+                    break
+                yield pd.DataFrame.from_records(records, columns=header)
+        finally:
+            workbook.close()
+
+    def _save(self, data: Iterable[pd.DataFrame]) -> None:
+        raise DataSetError(f"{self.__class__.__name__} is read-only")
+
+    def _exists(self) -> bool:
+        return isfile(self._filepath)
+
+
+class ChunkedParquetLocalDataSet(AbstractDataSet):
+    """Load and save a local Parquet file as an iterator of ``DataFrame`` chunks.
+
+    Each saved chunk is written as soon as it is produced, as one row group
+    of the file, and loading yields one chunk per row group.  Chunks after
+    the first are converted to the schema of the first chunk, so column types
+    stay consistent across the file.
+
+    Example:
+    ::
+
+        >>> import pandas as pd
+        >>>
+        >>> data = pd.DataFrame({"a": range(10), "b": range(10)})
+        >>> data_set = ChunkedParquetLocalDataSet(
+        >>>     "test.parquet", load_args={"columns": ["a"]}
+        >>> )
+        >>>
+        >>> data_set.save(data[i : i + 4] for i in range(0, 10, 4))
+        >>> reloaded = pd.concat(data_set.load(), ignore_index=True)
+        >>>
+        >>> assert data[["a"]].equals(reloaded)
+
+    """
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            load_args=self._load_args,
+            save_args=self._save_args,
+        )
+
+    def __init__(
+        self,
+        filepath: str,
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Creates a new ``ChunkedParquetLocalDataSet``.
+
+        Args:
+            filepath: Path to a local Parquet file.
+            load_args: Provided to underlying
+                ``pyarrow.parquet.ParquetFile.read_row_group`` method, e.g.
+                ``columns`` to read only some of the columns.  All defaults
+                are preserved.
+            save_args: Provided to underlying
+                ``pyarrow.parquet.ParquetWriter``, e.g. ``compression``.
+                All defaults are preserved.
+
+        """
+        self._filepath = filepath
+        self._load_args = load_args or {}
+        self._save_args = save_args or {}
+
+    def _load(self) -> Iterator[pd.DataFrame]:
+        parquet_file = pq.ParquetFile(self._filepath)
+        for index in range(parquet_file.num_row_groups):
+            yield parquet_file.read_row_group(index, **self._load_args).to_pandas()
+
+    def _save(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
+        if isinstance(data, pd.DataFrame):
+            data = [data]
+
+        writer = None
+        try:
+            for chunk in data:
+                schema = writer.schema if writer is not None else None
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        self._filepath, table.schema, **self._save_args
+                    )
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _exists(self) -> bool:
+        return isfile(self._filepath)
+
+
+class PartitionedCSVLocalDataSet(AbstractDataSet):
+    """Load and save a local directory of CSV partitions.
+
+    Saving accepts a dictionary or an iterable of ``(partition_id, data)``
+    pairs, where ``data`` is a ``DataFrame`` or a function returning one, and
+    writes each partition to ``<path>/<partition_id>.csv`` as soon as it is
+    produced.  Partitions left over from a previous save are removed first.
+    Loading returns a dictionary of functions that each load one partition,
+    like ``kedro.io.PartitionedDataSet``.
+
+    Example:
+    ::
+
+        >>> import pandas as pd
+        >>>
+        >>> data = pd.DataFrame({"a": range(10), "b": range(10)})
+        >>> data_set = PartitionedCSVLocalDataSet("test")
+        >>>
+        >>> data_set.save((str(i), data[data.a % 2 == i]) for i in range(2))
+        >>> reloaded = pd.concat(load() for load in data_set.load().values())
+        >>>
+        >>> assert data.equals(reloaded.sort_values("a").reset_index(drop=True))
+
+    """
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            path=self._path, load_args=self._load_args, save_args=self._save_args
+        )
+
+    def __init__(
+        self,
+        path: str,
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Creates a new ``PartitionedCSVLocalDataSet``.
+
+        Args:
+            path: Path to a local directory holding the partitions.
+            load_args: Provided to underlying ``pandas.read_csv``
+                function.  All defaults are preserved.
+            save_args: Provided to underlying ``pandas.DataFrame.to_csv``
+                function.  All defaults are preserved, but ``index``,
+                which is set to ``False``.
+
+        """
+        default_save_args = {"index": False}
+        self._path = path
+        self._load_args = load_args or {}
+        self._save_args = (
+            {**default_save_args, **save_args}
+            if save_args is not None
+            else default_save_args
+        )
+
+    def _partition_paths(self) -> Iterator[Path]:
+        return iter(sorted(Path(self._path).glob("*.csv")))
+
+    def _load(self) -> Dict[str, Callable[[], pd.DataFrame]]:
+        partitions = {
+            path.stem: partial(pd.read_csv, path, **self._load_args)
+            for path in self._partition_paths()
+        }
+        if not partitions:
+            raise DataSetError(f"No partitions found in `{self._path}`")
+        return partitions
+
+    def _save(self, data: Union[Dict[str, Any], Iterable[Tuple[str, Any]]]) -> None:
+        if isinstance(data, dict):
+            data = data.items()
+
+        Path(self._path).mkdir(parents=True, exist_ok=True)
+        for path in self._partition_paths():
+            path.unlink()
+
+        for partition_id, partition_data in data:
+            if callable(partition_data):
+                partition_data = partition_data()
+            partition_data.to_csv(
+                Path(self._path) / f"{partition_id}.csv", **self._save_args
+            )
+
+    def _exists(self) -> bool:
+        return next(self._partition_paths(), None) is not None
@@ -0,0 +1,283 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Datasets to load only newly appended rows and to append results."""
+import io
+import json
+import os
+from os.path import isfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataSet, DataSetError
+from kedro.io.core import generate_timestamp
+
+__all__ = ["IncrementalCSVLocalDataSet", "ParquetPartsLocalDataSet"]
+
+# Bytes read at a time when looking for the end of the last complete line.
+_TAIL_BLOCK_SIZE = 1 << 16
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Reads ``prefix``, then the next ``length`` bytes of ``file``, without
+    copying them into one buffer first.
+    """
+
+    def __init__(self, prefix: bytes, file: Any, length: int):
+        super().__init__()
+        self._prefix = prefix
+        self._file = file
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._prefix:
+            size = min(len(buffer), len(self._prefix))
+            buffer[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        size = min(len(buffer), self._remaining)
+        if not size:
+            return 0
+        size = self._file.readinto(memoryview(buffer)[:size])
+        self._remaining -= size
+        return size
+
+
+def _last_line_end(file: Any, start: int) -> int:
+    """Returns the offset just past the last line break of ``file`` at or
+    after ``start``, or ``start`` if there is none.
+    """
+    end = file.seek(0, os.SEEK_END)
+    while end > start:
+        block_start = max(start, end - _TAIL_BLOCK_SIZE)
+        file.seek(block_start)
+        newline = file.read(end - block_start).rfind(b"\n")
+        if newline >= 0:
+            return block_start + newline + 1
+        end = block_start
+    return start
+
+
+class IncrementalCSVLocalDataSet(AbstractDataSet):
+    """Load the rows appended to a local, append-only CSV file since the last
+    confirmed load.
+
+    The watermark, i.e. the number of rows and the byte offset already
+    processed, is kept in a JSON file, usually alongside the dataset built
+    from these rows.  ``confirm`` moves the watermark past the rows of the
+    last load; the project hooks call it once a run has succeeded, so a
+    failed run is retried from the same rows.  Loaded rows are indexed by
+    their row number in the file.
+
+    Incremental loads only read complete lines, leaving a line still being
+    appended for the next load, so quoted values must not contain line
+    breaks.
+
+    Example:
+    ::
+
+        >>> data_set = IncrementalCSVLocalDataSet(
+        >>>     "reviews.csv", watermark_filepath="reviews_watermark.json"
+        >>> )
+        >>> new_rows = data_set.load()
+        >>> data_set.confirm()
+        >>> assert data_set.load().empty
+
+    """
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            watermark_filepath=self._watermark_filepath,
+            incremental=self._incremental,
+            load_args=self._load_args,
+        )
+
+    def __init__(
+        self,
+        filepath: str,
+        watermark_filepath: str,
+        incremental: bool = True,
+        load_args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Creates a new ``IncrementalCSVLocalDataSet``.
+
+        Args:
+            filepath: Path to a local CSV file that is only ever appended to.
+            watermark_filepath: Path to the JSON file holding the watermark.
+            incremental: Whether to load only the rows past the watermark.
+                If ``False``, all rows are loaded and ``confirm`` still
+                moves the watermark to the end of the file, as needed
+                after a full rebuild.
+            load_args: Provided to underlying ``pandas.read_csv``
+                function.  All defaults are preserved.
+
+        """
+        self._filepath = filepath
+        self._watermark_filepath = watermark_filepath
+        self._incremental = incremental
+        self._load_args = load_args or {}
+        self._pending = None  # type: Optional[Dict[str, int]]
+
+    def _read_watermark(self) -> Dict[str, int]:
+        if not self._incremental or not isfile(self._watermark_filepath):
+            return {"rows": 0, "offset": 0}
+        with open(self._watermark_filepath) as file:
+            return json.load(file)
+
+    def _load(self) -> pd.DataFrame:
+        if not self._incremental:
+            with open(self._filepath, "rb") as file:
+                data = pd.read_csv(file, **self._load_args)
+                self._pending = {"rows": len(data), "offset": file.tell()}
+            return data
+
+        watermark = self._read_watermark()
+        with open(self._filepath, "rb") as file:
+            header = file.readline()
+            offset = max(watermark["offset"], file.tell())
+            end = _last_line_end(file, offset)
+            file.seek(offset)
+            data = pd.read_csv(
+                io.BufferedReader(_PrefixedReader(header, file, end - offset)),
+                **self._load_args,
+            )
+        data.index = pd.RangeIndex(watermark["rows"], watermark["rows"] + len(data))
+        self._pending = {"rows": watermark["rows"] + len(data), "offset": end}
+        return data
+
+    def _save(self, data: pd.DataFrame) -> None:
+        raise DataSetError(f"{self.__class__.__name__} is read-only")
+
+    def _exists(self) -> bool:
+        return isfile(self._filepath)
+
+    def confirm(self) -> None:
+        """Moves the watermark past the rows of the last load, if any."""
+        if self._pending is None:
+            return
+        Path(self._watermark_filepath).parent.mkdir(parents=True, exist_ok=True)
+        temporary_filepath = f"{self._watermark_filepath}.tmp"
+        with open(temporary_filepath, "w") as file:
+            json.dump(self._pending, file)
+        os.replace(temporary_filepath, self._watermark_filepath)
+        self._pending = None
+
+
+class ParquetPartsLocalDataSet(AbstractDataSet):
+    """Load and save a local directory of Parquet parts.
+
+    Loading reads all parts as one ``DataFrame``.  Saving writes one new
+    part, named after the save time so that parts load in the order they
+    were saved, and either replaces the existing parts or, with
+    ``append``, adds to them.  Appended data is converted to the schema of
+    the existing parts.  Files starting with ``_`` or ``.`` are not parts,
+    so metadata such as a watermark can be kept in the same directory.
+
+    Example:
+    ::
+
+        >>> import pandas as pd
+        >>>
+        >>> data = pd.DataFrame({"a": range(10), "b": range(10)})
+        >>> ParquetPartsLocalDataSet("test").save(data[:6])
+        >>> ParquetPartsLocalDataSet("test", append=True).save(data[6:])
+        >>> reloaded = ParquetPartsLocalDataSet("test").load()
+        >>>
+        >>> assert data.equals(reloaded)
+
+    """
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            path=self._path,
+            append=self._append,
+            load_args=self._load_args,
+            save_args=self._save_args,
+        )
+
+    def __init__(
+        self,
+        path: str,
+        append: bool = False,
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Creates a new ``ParquetPartsLocalDataSet``.
+
+        Args:
+            path: Path to a local directory holding the parts.
+            append: Whether saving adds a part instead of replacing them.
+            load_args: Provided to underlying ``pyarrow.parquet.read_table``
+                function, e.g. ``columns`` to read only some of the columns.
+                All defaults are preserved.
+            save_args: Provided to underlying ``pyarrow.parquet.write_table``
+                function, e.g. ``compression``.  All defaults are preserved.
+
+        """
+        self._path = path
+        self._append = append
+        self._load_args = load_args or {}
+        self._save_args = save_args or {}
+
+    def _parts(self):
+        return sorted(Path(self._path).glob("part-*.parquet"))
+
+    def _load(self) -> pd.DataFrame:
+        if not self._parts():
+            raise DataSetError(f"No parts found in `{self._path}`")
+        return pq.read_table(self._path, **self._load_args).to_pandas()
+
+    def _save(self, data: pd.DataFrame) -> None:
+        parts = self._parts()
+        if self._append and parts:
+            if data.empty:
+                return
+            schema = pq.read_schema(parts[0])
+            table = pa.Table.from_pandas(data, schema=schema, preserve_index=False)
+        else:
+            table = pa.Table.from_pandas(data, preserve_index=False)
+
+        path = Path(self._path)
+        path.mkdir(parents=True, exist_ok=True)
+        part = path / f"part-{generate_timestamp()}.parquet"
+        temporary_part = path / f".{part.name}.tmp"
+        pq.write_table(table, str(temporary_part), **self._save_args)
+        os.replace(temporary_part, part)
+
+        if not self._append:
+            for stale in parts:
+                stale.unlink()
+
+    def _exists(self) -> bool:
+        return bool(self._parts())
@@ -0,0 +1,217 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""``LinearModelLocalDataSet`` saves fitted scikit-learn linear models as a
+small JSON header followed by their memory-mappable arrays.
+"""
+import json
+import mmap
+import pickle
+import struct
+from functools import reduce
+from operator import mul
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Optional
+
+import numpy as np
+from kedro.io import AbstractVersionedDataSet, DataSetError, Version
+from kedro.utils import load_obj
+from sklearn.base import BaseEstimator, is_regressor
+
+from kedro_tutorial.io.versioning import VersionIndexMixin
+
+__all__ = ["LinearModelLocalDataSet"]
+
+_MAGIC = b"KTLM"
+_PREFIX = struct.Struct("<4sI")
+_ALIGNMENT = 64
+
+
+def _aligned(size: int) -> int:
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _linear_model_header(model: BaseEstimator) -> Optional[Dict[str, Any]]:
+    """The header describing ``model``, or ``None`` if it is not a linear
+    model whose fitted state is made of numbers and numeric arrays only.
+    """
+    model_class = type(model)
+    if not (
+        model_class.__module__.startswith("sklearn.linear_model")
+        and is_regressor(model)
+        and hasattr(model, "coef_")
+    ):
+        return None
+
+    header: Dict[str, Any] = {
+        "format": "linear_model",
+        "class": f"{model_class.__module__}.{model_class.__qualname__}",
+        "params": model.get_params(),
+        "scalars": {},
+        "arrays": {},
+    }
+    offset = 0
+    for name, value in vars(model).items():
+        if not name.endswith("_") or name.startswith("_"):
+            continue
+        if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+            header["arrays"][name] = {
+                "dtype": value.dtype.str,
+                "shape": value.shape,
+                "offset": offset,
+            }
+            offset += _aligned(value.nbytes)
+        elif value is None or isinstance(
+            value, (bool, int, float, str, np.bool_, np.number)
+        ):
+            header["scalars"][name] = (
+                value.item() if isinstance(value, np.generic) else value
+            )
+        else:
+            return None
+    try:
+        json.dumps(header)
+    except TypeError:
+        return None
+    return header
+
+
+class LinearModelLocalDataSet(VersionIndexMixin, AbstractVersionedDataSet):
+    """``LinearModelLocalDataSet`` loads and saves fitted scikit-learn linear
+    regressors, e.g. ``LinearRegression``, to a local file.
+
+    The file holds a JSON header, with the class, parameters and scalar
+    attributes of the model, followed by its array attributes, e.g.
+    ``coef_``, which are read-only views of the memory-mapped file once
+    loaded.  Loading neither unpickles nor copies the arrays.  Any other
+    model is pickled after the header instead, and unpickled on load.
+
+    Versions are indexed by ``VersionIndexMixin``, so the latest version is
+    resolved without listing them, and all but the latest ``keep_versions``
+    versions are removed on save.
+
+    Example:
+    ::
+
+        >>> from sklearn.linear_model import LinearRegression
+        >>>
+        >>> regressor = LinearRegression().fit([[0], [1]], [1, 3])
+        >>> data_set = LinearModelLocalDataSet(filepath="regressor.lm")
+        >>> data_set.save(regressor)
+        >>> reloaded = data_set.load()
+        >>>
+        >>> assert reloaded.predict([[2]]) == regressor.predict([[2]])
+
+    """
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            version=self._version,
+            keep_versions=self._keep_versions,
+        )
+
+    def __init__(
+        self,
+        filepath: str,
+        version: Version = None,
+        keep_versions: Optional[int] = None,
+    ) -> None:
+        """Creates a new instance of ``LinearModelLocalDataSet``.
+
+        Args:
+            filepath: Path to the model file.
+            version: If specified, should be an instance of
+                ``kedro.io.core.Version``. If its ``load`` attribute is
+                None, the latest version will be loaded. If its ``save``
+                attribute is None, save version will be autogenerated.
+            keep_versions: Number of latest versions to keep when saving,
+                all by default.
+
+        """
+        super().__init__(PurePosixPath(filepath), version)
+        self._keep_versions = keep_versions
+
+    def _load(self) -> BaseEstimator:
+        load_path = str(self._get_load_path())
+        with open(load_path, "rb") as file:
+            magic, header_size = _PREFIX.unpack(file.read(_PREFIX.size))
+            if magic != _MAGIC:
+                raise DataSetError(f"`{load_path}` is not a model file")
+            header = json.loads(file.read(header_size))
+            data_offset = _aligned(_PREFIX.size + header_size)
+            if header["format"] == "pickle":
+                file.seek(data_offset)
+                return pickle.load(file)
+            buffer = (
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                if header["arrays"]
+                else b""
+            )
+
+        model = load_obj(header["class"])(**header["params"])
+        for name, value in header["scalars"].items():
+            setattr(model, name, value)
+        for name, array in header["arrays"].items():
+            dtype = np.dtype(array["dtype"])
+            shape = tuple(array["shape"])
+            values = np.frombuffer(
+                buffer,
+                dtype=dtype,
+                count=reduce(mul, shape, 1),
+                offset=data_offset + array["offset"],
+            )
+            setattr(model, name, values.reshape(shape))
+        return model
+
+    def _save(self, data: BaseEstimator) -> None:
+        header = _linear_model_header(data) or {"format": "pickle"}
+        encoded_header = json.dumps(header).encode()
+        data_offset = _aligned(_PREFIX.size + len(encoded_header))
+
+        save_path = Path(self._get_save_path())
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(save_path, "wb") as file:
+            file.write(_PREFIX.pack(_MAGIC, len(encoded_header)))
+            file.write(encoded_header)
+            file.seek(data_offset)
+            if header["format"] == "pickle":
+                pickle.dump(data, file)
+            else:
+                for name, array in header["arrays"].items():
+                    file.seek(data_offset + array["offset"])
+                    file.write(np.ascontiguousarray(getattr(data, name)).tobytes())
+
+        if self._version:
+            self._index_version(save_path)
+
+    def _exists(self) -> bool:
+        try:
+            path = self._get_load_path()
+        except DataSetError:
+            return False
+        return Path(path).is_file()
@@ -26,4 +26,5 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """``kedro.contrib.io.powerpoint`` provides McK PowerPoint table I/O."""
+from .partitioned_local import PowerPointPartitionedLocalDataSet  # NOQA
 from .powerpoint_local import PowerPointLocalDataSet  # NOQA
@@ -0,0 +1,127 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""``PowerPointPartitionedLocalDataSet`` loads and saves a dictionary of data
+to the tables of consecutive slides of a McK PPT presentation.
+"""
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import pandas as pd
+from kedro.io import DataSetError
+from pptx import Presentation
+
+from .powerpoint_local import PowerPointLocalDataSet
+
+__all__ = ["PowerPointPartitionedLocalDataSet"]
+
+
+class PowerPointPartitionedLocalDataSet(PowerPointLocalDataSet):
+    """Load and save a dictionary of data to the tables of consecutive slides
+    of a McK Digital format presentation, in a single file.
+
+    Each partition is saved to a copy of the table slide of the template,
+    titled and named after the partition, so the template is opened and the
+    file written once for all of them.  Loading returns a dictionary of
+    functions reading the table of each partition, as ``PartitionedDataSet``
+    does, from a presentation opened once.
+
+    Example:
+    ::
+
+        >>> from kedro_tutorial.io.powerpoint import PowerPointPartitionedLocalDataSet
+        >>> import pandas as pd
+        >>>
+        >>> data = {
+        >>>     "train": pd.DataFrame({"r2_score": [0.5]}),
+        >>>     "test": pd.DataFrame({"r2_score": [0.4]}),
+        >>> }
+        >>> data_set = PowerPointPartitionedLocalDataSet("test.pptx")
+        >>>
+        >>> data_set.save(data)
+        >>> reloaded = data_set.load()
+        >>>
+        >>> assert data["test"].equals(reloaded["test"]())
+
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Creates a new ``PowerPointPartitionedLocalDataSet``.
+
+        Args:
+            filepath: Path to a ``.pptx`` file.
+            load_args: As for ``PowerPointLocalDataSet``, but ``slide_name``,
+                and with ``partitions``, the names of the partitions to load.
+                Defaults to ``None``, to load all partitions.
+            save_args: As for ``PowerPointLocalDataSet``, but ``title``, as
+                the slides are titled after the partitions.
+
+        """
+        super().__init__(
+            filepath,
+            load_args={"partitions": None, **(load_args or {})},
+            save_args=save_args,
+        )
+        self._load_args.pop("slide_name")
+        self._save_args.pop("title")
+
+    def _load(self) -> Dict[str, Callable[[], pd.DataFrame]]:
+        prs = Presentation(self._filepath)
+        load_args = self._load_args.copy()
+        partitions: Optional[Iterable[str]] = load_args.pop("partitions")
+        slides = list(prs.slides)
+        tables = {
+            self._unescape_name(slide.name): self._table_slides(slides, index)
+            for index, slide in enumerate(slides)
+            if slide.name != self._CONTINUED_SLIDE_NAME
+        }
+        if partitions is None:
+            partitions = tables
+        missing = set(partitions) - tables.keys()
+        if missing:
+            raise DataSetError(f"No slides for partitions {sorted(missing)}")
+        return {
+            partition: partial(self._read_slides, tables[partition], load_args)
+            for partition in partitions
+        }
+
+    def _save(self, data: Dict[str, pd.DataFrame]) -> None:
+        assert self._save_args.get("index", True)
+        if not data:
+            raise DataSetError("No partitions to save")
+        not_names = [partition for partition in data if not isinstance(partition, str)]
+        if not_names:
+            raise DataSetError(f"Partition names must be strings, got {not_names}")
+        prs = self._get_template()
+        tables = [(partition, partition, table) for partition, table in data.items()]
+        self._write_slides(prs, tables, self._save_args)
+        prs.save(self._filepath)
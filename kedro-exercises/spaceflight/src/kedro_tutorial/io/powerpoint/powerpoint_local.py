@@ -26,15 +26,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """``PowerPointLocalDataSet`` loads and saves data to McK PPT tables."""
+import csv
+import hashlib
 import io
-from itertools import cycle
-from os.path import dirname, join
-from typing import Any, Dict, Optional
-
+import os
+from copy import deepcopy
+from functools import lru_cache
+from itertools import takewhile
+from os.path import abspath, basename, dirname, expanduser, getmtime, join, splitext
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 import pptx
 from pptx import Presentation
 from pptx.enum.dml import MSO_FILL
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
 from pptx.slide import Slide
 from pptx.table import Table, _Cell, _Row
 
@@ -42,9 +50,110 @@ from kedro.io import AbstractDataSet, DataSetError
 
 __all__ = ["PowerPointLocalDataSet"]
 
-
-def _format_cells(row: _Row, line: str, like: _Cell):
-    for cell, value in zip(row.cells, line.split(",")):
+TEMPLATE_FILEPATH = join(
+    dirname(__file__), "templates", "Digital_Standard_format_Aug 25.pptx"
+)
+TEMPLATE_SLIDE_INDEX = 40
+# Where the templates pruned to their table slide are cached.
+PRUNED_TEMPLATE_DIR = join(expanduser("~"), ".cache", "kedro_tutorial")
+
+# Load arguments handled without going through ``pandas.read_csv``.
+_DIRECT_LOAD_ARGS = {"index_col", "header"}
+# The default missing and boolean values of ``pandas.read_csv``.
+_NA_VALUES = ["", "#N/A", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"]
+_TRUE_VALUES = {"True", "TRUE", "true"}
+_FALSE_VALUES = {"False", "FALSE", "false"}
+
+_RELATIONSHIP_NAMESPACE = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
+
+
+def _prune_template(template_filepath: str, slide_index: int) -> bytes:
+    prs = Presentation(template_filepath)
+
+    # Delete all slides except for the slide containing the table.
+    # See https://github.com/scanny/python-pptx/issues/67#issuecomment-287109303.
+    slide_id_list = list(
+        enumerate(prs.slides._sldIdLst)  # pylint: disable=protected-access
+    )
+    del slide_id_list[slide_index]
+    for i, slide_id in reversed(slide_id_list):
+        prs.part.drop_rel(slide_id.rId)
+        del prs.slides._sldIdLst[i]  # pylint: disable=protected-access
+
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _pruned_template(template_filepath: str, slide_index: int) -> bytes:
+    """Returns the template with only slide ``slide_index`` left, as the bytes
+    of a ``.pptx`` file.  It is built once, and cached in
+    ``PRUNED_TEMPLATE_DIR`` until the template changes.
+    """
+    root, extension = splitext(basename(template_filepath))
+    template_hash = hashlib.sha1(abspath(template_filepath).encode()).hexdigest()
+    pruned_filepath = join(
+        PRUNED_TEMPLATE_DIR,
+        f"{root}.{template_hash[:12]}.slide-{slide_index}{extension}",
+    )
+    try:
+        if getmtime(pruned_filepath) >= getmtime(template_filepath):
+            with open(pruned_filepath, "rb") as pruned_file:
+                return pruned_file.read()
+    except OSError:
+        pass
+
+    pruned = _prune_template(template_filepath, slide_index)
+    temporary_filepath = f"{pruned_filepath}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(PRUNED_TEMPLATE_DIR, exist_ok=True)
+        with open(temporary_filepath, "wb") as pruned_file:
+            pruned_file.write(pruned)
+        os.replace(temporary_filepath, pruned_filepath)
+    except OSError:
+        # The cache directory may not be writable, in which case the
+        # template is pruned once per process.
+        pass
+    return pruned
+
+
+def _duplicate_slide(prs: Any, slide: Slide) -> Slide:
+    """Appends a copy of ``slide``, with its shapes, background and the parts
+    they refer to, such as images, to ``prs``.
+    """
+    duplicate = prs.slides.add_slide(slide.slide_layout)
+    sp_tree = duplicate.shapes._spTree  # pylint: disable=protected-access
+    for shape in list(duplicate.shapes):
+        sp_tree.remove(shape._element)  # pylint: disable=protected-access
+
+    rids = {}
+    for rid, rel in slide.part.rels.items():
+        if rel.reltype in (RT.SLIDE_LAYOUT, RT.NOTES_SLIDE):
+            continue
+        target = rel.target_ref if rel.is_external else rel.target_part
+        rids[rid] = duplicate.part.relate_to(target, rel.reltype, rel.is_external)
+
+    elements = [deepcopy(shape._element) for shape in slide.shapes]
+    for element in elements:
+        sp_tree.insert_element_before(element, "p:extLst")
+    background = slide._element.cSld.bg  # pylint: disable=protected-access
+    if background is not None:
+        elements.append(deepcopy(background))
+        duplicate._element.cSld.insert(0, elements[-1])
+
+    for element in elements:
+        for descendant in element.iter():
+            for key, value in descendant.attrib.items():
+                if key.startswith(_RELATIONSHIP_NAMESPACE) and value in rids:
+                    descendant.set(key, rids[value])
+    return duplicate
+
+
+def _format_cells(row: _Row, values: List[str], like: _Cell):
+    for cell, value in zip(row.cells, values):
         if like.fill.type == MSO_FILL.BACKGROUND:
             cell.fill.background()
         elif like.fill.type == MSO_FILL.SOLID:
@@ -64,6 +173,86 @@ def _format_cells(row: _Row, line: str, like: _Cell):
         cell.text_frame._set_font(font.name, font.size.pt, font.bold, font.italic)
 
 
+def _cell_text(tc: Any) -> str:
+    return "\n".join("".join(p.itertext(qn("a:t"))) for p in tc.iter(qn("a:p")))
+
+
+def _infer_column(values: List[str]) -> np.ndarray:
+    """Converts the text of a column to booleans or numbers, as
+    ``pandas.read_csv`` would, or else keeps it as text.
+    """
+    array = np.array(values, dtype=object)
+    if not values:
+        return array
+    missing = np.isin(array, _NA_VALUES)
+    present = set(array[~missing])
+    if present and present <= _TRUE_VALUES | _FALSE_VALUES:
+        booleans = np.isin(array, list(_TRUE_VALUES))
+        if not missing.any():
+            return booleans
+        # Like ``pandas.read_csv``, booleans with missing values are objects.
+        array[:] = booleans
+        array[missing] = np.nan
+        return array
+    array[missing] = np.nan
+    try:
+        return pd.to_numeric(array)
+    except (TypeError, ValueError):
+        return array
+
+
+def _deduplicate(names: List[str]) -> List[str]:
+    """Renames repeated column names ``a``, ``a.1``, ``a.2``, ..., skipping
+    names in the header, as ``pandas.read_csv`` does.
+    """
+    counts: Dict[str, int] = {}
+    deduplicated = []
+    for name in names:
+        base = name
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in names else counts.get(name, 0)
+        deduplicated.append(name)
+        counts[name] = count + 1
+    return deduplicated
+
+
+def _to_frame(
+    rows: List[List[str]], index_col: Any = None, header: Optional[int] = 0
+) -> pd.DataFrame:
+    """Builds a ``DataFrame`` from the text of the table cells, as
+    ``pandas.read_csv`` would from the same table written as CSV.
+    """
+    if header is None:
+        names = list(range(len(rows[0])))
+    else:
+        header_row, *rows = rows
+        names = _deduplicate(
+            [name or f"Unnamed: {position}" for position, name in enumerate(header_row)]
+        )
+    columns = zip(*rows) if rows else ([] for _ in names)
+    data = pd.DataFrame(
+        {
+            position: _infer_column(list(values))
+            for position, values in enumerate(columns)
+        }
+    )
+    data.columns = names
+
+    if index_col is not None and index_col is not False:
+        keys = index_col if isinstance(index_col, (list, tuple)) else [index_col]
+        data = data.set_index(
+            [data.columns[key] if isinstance(key, int) else key for key in keys]
+        )
+        data.index.names = [
+            None if isinstance(name, str) and name.startswith("Unnamed: ") else name
+            for name in data.index.names
+        ]
+    return data
+
+
 class PowerPointLocalDataSet(AbstractDataSet):
     """Load and save data to tables in McK Digital format presentations.
 
@@ -112,7 +301,10 @@ class PowerPointLocalDataSet(AbstractDataSet):
                 function.  To find all supported arguments, see here:
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.read_csv.html
                 All defaults are preserved, but ``index_col``, which is
-                set to ``0``.
+                set to ``0``.  The table is read directly, as
+                ``pandas.read_csv`` would read it, unless arguments other
+                than ``index_col`` and ``header`` (``0`` or ``None``) are
+                given.
 
                 ``slide_name`` specifies which slide to get.  Available
                 cases:
@@ -126,13 +318,18 @@ class PowerPointLocalDataSet(AbstractDataSet):
 
                 ``title`` replaces "Table" in the title placeholder (if specified).
 
+                ``rows_per_slide`` splits the table across as many
+                consecutive slides as needed to hold at most that many rows
+                each, under a repeated header row and title (if specified).
+                Loading a slide also loads the slides continuing its table.
+
         Raises:
             DataSetError: When slide ``slide_name`` does not contain a
-                table.
+                table, or ``rows_per_slide`` is not a positive integer.
 
         """
         default_load_args = {"slide_name": 0, "index_col": 0}
-        default_save_args = {"title": None}
+        default_save_args = {"title": None, "rows_per_slide": None}
         self._filepath = filepath
         self._load_args = (
             {**default_load_args, **load_args}
@@ -144,6 +341,33 @@ class PowerPointLocalDataSet(AbstractDataSet):
             if save_args is not None
             else default_save_args
         )
+        rows_per_slide = self._save_args["rows_per_slide"]
+        if rows_per_slide is not None and (
+            isinstance(rows_per_slide, bool)
+            or not isinstance(rows_per_slide, int)
+            or rows_per_slide < 1
+        ):
+            raise DataSetError(
+                f"`rows_per_slide` must be a positive integer, got {rows_per_slide!r}"
+            )
+
+    # The name of the slides continuing the table of the slide before them.
+    # The names of tables starting with it are escaped by repeating it, so
+    # that no table is named like them.
+    _CONTINUED_SLIDE_NAME = "~"
+
+    @classmethod
+    def _escape_name(cls, name: str) -> str:
+        if name.startswith(cls._CONTINUED_SLIDE_NAME):
+            return cls._CONTINUED_SLIDE_NAME + name
+        return name
+
+    @classmethod
+    def _unescape_name(cls, slide_name: str) -> str:
+        if slide_name.startswith(cls._CONTINUED_SLIDE_NAME):
+            escape_length = len(cls._CONTINUED_SLIDE_NAME)
+            return slide_name[escape_length:]
+        return slide_name
 
     @staticmethod
     def _get_table(slide: Slide) -> Table:
@@ -155,70 +379,160 @@ class PowerPointLocalDataSet(AbstractDataSet):
     def _load(self) -> pd.DataFrame:
         prs = Presentation(self._filepath)
         load_args = self._load_args.copy()
-        slide = prs.slides[load_args.pop("slide_name")]
-        table = self._get_table(slide)
+        slides = list(prs.slides)
+        index = range(len(slides))[load_args.pop("slide_name")]
+        return self._read_slides(self._table_slides(slides, index), load_args)
+
+    @classmethod
+    def _table_slides(cls, slides: List[Slide], index: int) -> List[Slide]:
+        """Returns the slide at ``index`` and the slides continuing its table."""
+        start = index + 1
+        continued = takewhile(
+            lambda slide: slide.name == cls._CONTINUED_SLIDE_NAME, slides[start:]
+        )
+        return [slides[index], *continued]
+
+    @classmethod
+    def _read_slides(
+        cls, slides: List[Slide], load_args: Dict[str, Any]
+    ) -> pd.DataFrame:
+        rows: List[List[str]] = []
+        for slide in slides:
+            tbl = cls._get_table(slide)._tbl  # pylint: disable=protected-access
+            trs = tbl.tr_lst[1:] if rows else tbl.tr_lst
+            rows.extend([_cell_text(tc) for tc in tr.tc_lst] for tr in trs)
+        header = load_args.get("header", 0)
+        if load_args.keys() <= _DIRECT_LOAD_ARGS and header in (0, None):
+            return _to_frame(rows, **load_args)
+
         buffer = io.StringIO()
-        for row in table.rows:
-            buffer.write(",".join(cell.text for cell in row.cells))
-            buffer.write("\n")
+        csv.writer(buffer).writerows(rows)
         buffer.seek(0)
         return pd.read_csv(buffer, **load_args)
 
     @staticmethod
     def _get_template() -> pptx.presentation.Presentation:
-        prs = Presentation(
-            join(dirname(__file__), "templates", "Digital_Standard_format_Aug 25.pptx")
-        )
-
-        # Delete all slides except for the slide containing the table.
-        # See https://github.com/scanny/python-pptx/issues/67#issuecomment-287109303.
-        slide_id_list = list(
-            enumerate(prs.slides._sldIdLst)  # pylint: disable=protected-access
-        )
-        del slide_id_list[40]
-        for i, slide_id in reversed(slide_id_list):
-            prs.part.drop_rel(slide_id.rId)
-            del prs.slides._sldIdLst[i]  # pylint: disable=protected-access
-
-        return prs
+        template = _pruned_template(TEMPLATE_FILEPATH, TEMPLATE_SLIDE_INDEX)
+        return Presentation(io.BytesIO(template))
 
     def _save(self, data: pd.DataFrame) -> None:
         assert self._save_args.get("index", True)
         prs = self._get_template()
-        [slide] = prs.slides
         save_args = self._save_args.copy()
         title = save_args.pop("title")
+        self._write_slides(prs, [(None, title, data)], save_args)
+        prs.save(self._filepath)
+
+    @classmethod
+    def _write_slides(
+        cls,
+        prs: pptx.presentation.Presentation,
+        tables: List[Tuple[Optional[str], Optional[str], pd.DataFrame]],
+        save_args: Dict[str, Any],
+    ) -> None:
+        """Writes each table of ``tables``, given as a slide name, a title and
+        the data, to consecutive copies of the template slide, paginated as
+        specified by ``save_args``.
+        """
+        save_args = save_args.copy()
+        rows_per_slide = save_args.pop("rows_per_slide")
+        pages = []
+        for name, title, data in tables:
+            # Quoted values may contain commas and newlines.
+            header, *records = csv.reader(io.StringIO(data.to_csv(**save_args)))
+            page_size = rows_per_slide or len(records) or 1
+            for start in range(0, max(len(records), 1), page_size):
+                stop = start + page_size
+                if start > 0:
+                    page_name = cls._CONTINUED_SLIDE_NAME
+                elif name is not None:
+                    page_name = cls._escape_name(name)
+                else:
+                    page_name = None
+                page_records = [header, *records[start:stop]]
+                pages.append((page_name, title, page_records, data.shape[1] + 1))
+
+        [template_slide] = prs.slides
+        slides = [template_slide] + [
+            _duplicate_slide(prs, template_slide) for _ in pages[1:]
+        ]
+        styles: Dict[int, List[Any]] = {}
+        for slide, (name, title, records, ncols) in zip(slides, pages):
+            if name is not None:
+                c_sld = slide._element.cSld  # pylint: disable=protected-access
+                c_sld.set("name", name)
+            styled_trs = cls._write_slide(
+                slide, records, ncols, title, styles.get(ncols)
+            )
+            if len(styled_trs) == 3:
+                styles.setdefault(ncols, styled_trs)
+
+    @classmethod
+    def _write_slide(
+        cls,
+        slide: Slide,
+        records: List[List[str]],
+        ncols: int,
+        title: Optional[str],
+        styled_trs: Optional[List[Any]] = None,
+    ) -> List[Any]:
+        """Writes the CSV ``records`` to the table of ``slide``, and returns its
+        styled header and band rows.  When ``styled_trs``, the rows returned
+        for an earlier table with as many columns, are given, the rows are
+        copied from them instead of being styled again.
+        """
         if title is not None:
             slide.shapes.title.text = title
 
         # Replace the example table with an appropriately-sized table.
         # See https://github.com/scanny/python-pptx/issues/246#issuecomment-266124095.
-        old_table = self._get_table(slide)._graphic_frame
-        nrows, ncols = data.shape
+        # Only the header row and a row per band are created and styled, once
+        # per save; the other rows are copies of them.
+        old_table = cls._get_table(slide)._graphic_frame
+        nrows = len(records) - 1
         header_row, first_data_row, second_data_row, *_ = old_table.table.rows
+        styled_nrows = 1 + min(nrows, 2)
         new_table = slide.shapes.add_table(
-            nrows + 1,
-            ncols + 1,
+            styled_nrows,
+            ncols,
             old_table.left,
             old_table.top,
             old_table.width,
-            (nrows + 1) * header_row.height,
+            styled_nrows * header_row.height,
         )
+        new_table.height = (nrows + 1) * header_row.height
         old_element = old_table._element
         new_element = new_table._element
         old_element.addnext(new_element)
         old_element.getparent().remove(old_element)
 
         table = new_table.table
-        rows_and_lines = zip(table.rows, data.to_csv(**save_args).splitlines())
-
-        row, line = next(rows_and_lines)
-        _format_cells(
-            row, line, header_row.cells[1]  # First cell of header row contains no runs
-        )
-
-        bands = [first_data_row.cells[0], second_data_row.cells[0]]
-        for (row, line), band in zip(rows_and_lines, cycle(bands)):
-            _format_cells(row, line, band)
-
-        prs.save(self._filepath)
+        tbl = table._tbl  # pylint: disable=protected-access
+        if styled_trs is None:
+            rows_and_records = zip(table.rows, records)
+
+            row, values = next(rows_and_records)
+            _format_cells(
+                row,
+                values,
+                header_row.cells[1],  # First cell of header row contains no runs
+            )
+
+            bands = [first_data_row.cells[0], second_data_row.cells[0]]
+            for (row, values), band in zip(rows_and_records, bands):
+                _format_cells(row, values, band)
+
+            styled_trs = tbl.tr_lst
+            start = styled_nrows
+        else:
+            for tr in tbl.tr_lst:
+                tbl.remove(tr)
+            start = 0
+
+        header_tr, *band_trs = styled_trs
+        for index, values in enumerate(records[start:], start):
+            tr = deepcopy(band_trs[(index - 1) % 2] if index else header_tr)
+            for text, value in zip(tr.iter(qn("a:t")), values):
+                text.text = value
+            tbl.append(tr)
+        return styled_trs
@@ -0,0 +1,173 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""``SidecarCachedDataSet`` serves a slow-to-parse local file from a Parquet sidecar."""
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataSet, DataSetError
+
+__all__ = ["SidecarCachedDataSet"]
+
+_FINGERPRINT_KEY = b"kedro_tutorial.sidecar"
+
+
+def _sha256(filepath: str) -> str:
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SidecarCachedDataSet(AbstractDataSet):
+    """Wrap a dataset whose source file is slow to parse, e.g. an Excel
+    workbook, and serve loads from a Parquet sidecar of its data.
+
+    The sidecar is written on the first load and records the size,
+    modification time and SHA-256 hash of the source file, together with
+    the wrapped dataset's configuration.  Later loads only ``stat`` the
+    source file; the sidecar is rebuilt when the file was changed, or kept
+    if the file was merely touched and its hash still matches.
+
+    Example:
+    ::
+
+        >>> data_set = SidecarCachedDataSet(
+        >>>     dataset={"type": "pandas.ExcelDataSet", "filepath": "shuttles.xlsx"},
+        >>>     sidecar_filepath="shuttles.xlsx.parquet",
+        >>> )
+        >>> data = data_set.load()  # parses the workbook
+        >>> data = data_set.load()  # reads the sidecar
+
+    """
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            dataset=self._dataset._describe(),  # pylint: disable=protected-access
+            filepath=self._filepath,
+            sidecar_filepath=self._sidecar_filepath,
+        )
+
+    def __init__(
+        self,
+        dataset: Union[AbstractDataSet, Dict[str, Any]],
+        sidecar_filepath: Optional[str] = None,
+        filepath: Optional[str] = None,
+    ) -> None:
+        """Creates a new ``SidecarCachedDataSet``.
+
+        Args:
+            dataset: The wrapped dataset, either as an instance or as its
+                configuration, in the same form as a catalog entry.
+            sidecar_filepath: Path of the Parquet sidecar.  Defaults to the
+                source file path with a ``.parquet`` suffix appended.
+            filepath: Path of the source file to fingerprint.  Defaults to
+                ``filepath`` of the ``dataset`` configuration.
+
+        Raises:
+            DataSetError: When the source file path cannot be determined.
+
+        """
+        if isinstance(dataset, dict):
+            filepath = filepath or dataset.get("filepath")
+            dataset = AbstractDataSet.from_config("_sidecar", dataset)
+        if filepath is None:
+            raise DataSetError(
+                "`filepath` must be given unless it is part of the `dataset` "
+                "configuration"
+            )
+        self._dataset = dataset
+        self._filepath = filepath
+        self._sidecar_filepath = sidecar_filepath or f"{filepath}.parquet"
+
+    def _read_fingerprint(self) -> Optional[Dict[str, Any]]:
+        try:
+            metadata = pq.read_schema(self._sidecar_filepath).metadata or {}
+        except (OSError, pa.ArrowException):
+            return None
+        fingerprint = metadata.get(_FINGERPRINT_KEY)
+        return json.loads(fingerprint) if fingerprint is not None else None
+
+    def _write_sidecar(self, data: pd.DataFrame, fingerprint: Dict[str, Any]) -> None:
+        try:
+            table = pa.Table.from_pandas(data)
+        except pa.ArrowException as exc:
+            self._logger.warning(
+                "Not caching `%s`, its data cannot be stored as Parquet: %s",
+                self._filepath,
+                exc,
+            )
+            return
+        metadata = {
+            **(table.schema.metadata or {}),
+            _FINGERPRINT_KEY: json.dumps(fingerprint).encode(),
+        }
+        # Write to a temporary file first, so that a partly written sidecar
+        # is never served.
+        temporary_filepath = f"{self._sidecar_filepath}.tmp"
+        pq.write_table(table.replace_schema_metadata(metadata), temporary_filepath)
+        os.replace(temporary_filepath, self._sidecar_filepath)
+
+    def _load(self) -> pd.DataFrame:
+        stat = os.stat(self._filepath)
+        fingerprint = dict(
+            size=stat.st_size, mtime_ns=stat.st_mtime_ns, source=str(self._dataset)
+        )
+        cached = self._read_fingerprint()
+        if cached is not None and all(
+            cached.get(key) == value for key, value in fingerprint.items()
+        ):
+            return pq.read_table(self._sidecar_filepath).to_pandas()
+
+        fingerprint["sha256"] = _sha256(self._filepath)
+        if (
+            cached is not None
+            and cached.get("sha256") == fingerprint["sha256"]
+            and cached.get("source") == fingerprint["source"]
+        ):
+            # Only the modification time changed, refresh the fingerprint.
+            data = pq.read_table(self._sidecar_filepath).to_pandas()
+        else:
+            self._logger.info(
+                "Building sidecar `%s` for `%s`", self._sidecar_filepath, self._filepath
+            )
+            data = self._dataset.load()
+        self._write_sidecar(data, fingerprint)
+        return data
+
+    def _save(self, data: pd.DataFrame) -> None:
+        # The sidecar is invalidated by the change of the source file.
+        self._dataset.save(data)
+
+    def _exists(self) -> bool:
+        return self._dataset.exists()
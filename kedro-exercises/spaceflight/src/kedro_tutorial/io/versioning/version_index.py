@@ -0,0 +1,153 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""``VersionIndexMixin`` keeps an index of the versions of a versioned local
+dataset, to resolve the latest version without listing them, and prunes
+old versions.
+"""
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+INDEX_FILENAME = "_versions.json"
+
+
+class VersionIndexMixin:
+    """Mixin for an ``AbstractVersionedDataSet`` saving to local files.
+
+    ``_index_version`` must be called after each save.  It records the saved
+    version in ``<filepath>/_versions.json``, together with the size of the
+    saved file and the time of the save, and removes all but the latest
+    ``keep_versions`` versions, if set.  The latest version is then resolved
+    from the index.
+
+    The index is current while its modification time matches the one of
+    the dataset directory, which changes whenever a version is added or
+    removed.  When the index is missing or out of date, e.g. for versions
+    saved before it existed or without it, by another process or a plain
+    versioned dataset, it is rebuilt by listing the versions.
+    """
+
+    _keep_versions: Optional[int] = None
+
+    @property
+    def _index_path(self) -> Path:
+        return Path(str(self._filepath)) / INDEX_FILENAME
+
+    def _read_index(self) -> Dict[str, Any]:
+        try:
+            with open(self._index_path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {"latest": None, "versions": {}}
+
+    def _write_index(self, index: Dict[str, Any]) -> None:
+        temporary_path = f"{self._index_path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(index, file, indent=1, sort_keys=True)
+        os.replace(temporary_path, self._index_path)
+        # Marks the index as current, see ``_index_is_current``.
+        mtime = self._index_path.parent.stat().st_mtime_ns
+        os.utime(self._index_path, ns=(mtime, mtime))
+
+    def _index_is_current(self) -> bool:
+        try:
+            index_mtime = self._index_path.stat().st_mtime_ns
+            return index_mtime == self._index_path.parent.stat().st_mtime_ns
+        except OSError:
+            return False
+
+    def _version_path(self, version: str) -> Path:
+        filepath = Path(str(self._filepath))
+        return filepath / version / filepath.name
+
+    def _rebuild_index(self, known: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Lists the versions, taking the entries of those already in the
+        ``known`` versions from them rather than from the version files.
+        """
+        known = known or {}
+        index: Dict[str, Any] = {"latest": None, "versions": {}}
+        filepath = Path(str(self._filepath))
+        if not filepath.is_dir():
+            return index
+        with os.scandir(filepath) as entries:
+            versions = [entry.name for entry in entries if entry.is_dir()]
+        for version in versions:
+            if version in known:
+                index["versions"][version] = known[version]
+                continue
+            path = self._version_path(version)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            index["versions"][version] = {
+                "path": str(path),
+                "bytes": stat.st_size,
+                "saved_at": datetime.fromtimestamp(
+                    stat.st_mtime, timezone.utc
+                ).isoformat(),
+            }
+        if index["versions"]:
+            index["latest"] = max(index["versions"])
+            self._write_index(index)
+        return index
+
+    def _fetch_latest_load_version(self) -> str:
+        latest = self._read_index()["latest"]
+        if (
+            latest is None
+            or not self._index_is_current()
+            or not self._version_path(latest).is_file()
+        ):
+            latest = self._rebuild_index()["latest"]
+        if latest is None:
+            # Raises the usual error for a dataset without versions.
+            return super()._fetch_latest_load_version()
+        return latest
+
+    def _index_version(self, save_path: Path) -> None:
+        # The save itself changed the dataset directory, so the versions are
+        # listed again to find any other new version; only these are read.
+        index = self._rebuild_index(self._read_index()["versions"])
+        version = save_path.parent.name
+        index["versions"][version] = {
+            "path": str(save_path),
+            "bytes": save_path.stat().st_size,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+        versions = sorted(index["versions"])
+        index["latest"] = versions[-1]
+        if self._keep_versions:
+            for pruned in versions[: -self._keep_versions]:
+                shutil.rmtree(self._version_path(pruned).parent, ignore_errors=True)
+                del index["versions"][pruned]
+        self._write_index(index)
@@ -1 +1,6 @@
-from .pipeline import create_pipeline  # NOQA
+from .pipeline import (  # NOQA
+    create_incremental_pipeline,
+    create_out_of_core_pipeline,
+    create_pipeline,
+    create_streaming_pipeline,
+)
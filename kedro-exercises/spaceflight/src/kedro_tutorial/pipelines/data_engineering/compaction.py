@@ -0,0 +1,84 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lossless dtype compaction of preprocessed tables.
+
+Every conversion is checked by casting back to the original dtype; a column
+is only replaced when it compares equal afterwards, missing values included.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _compact_column(
+    column: pd.Series, downcast_floats: bool, max_category_ratio: float
+) -> pd.Series:
+    dtype = column.dtype
+    if pd.api.types.is_extension_array_dtype(dtype) or pd.api.types.is_bool_dtype(
+        dtype
+    ):
+        return column
+
+    if pd.api.types.is_integer_dtype(dtype):
+        candidate = pd.to_numeric(column, downcast="integer")
+    elif pd.api.types.is_float_dtype(dtype) and downcast_floats:
+        # Out-of-range values become infinite and fail the check below.
+        with np.errstate(over="ignore"):
+            candidate = column.astype("float32")
+    elif dtype == object and len(column):
+        if column.nunique(dropna=False) / len(column) > max_category_ratio:
+            return column
+        candidate = column.astype("category")
+    else:
+        return column
+
+    if candidate.dtype == dtype or not candidate.astype(dtype).equals(column):
+        return column
+    return candidate
+
+
+def compact(
+    data: pd.DataFrame, downcast_floats: bool = True, max_category_ratio: float = 0.5
+) -> pd.DataFrame:
+    """Converts columns to the most compact dtype that holds the same values.
+
+        Args:
+            data: Table to compact.
+            downcast_floats: Whether ``float64`` columns may become ``float32``.
+            max_category_ratio: ``object`` columns become categoricals when
+                their share of distinct values is at most this ratio.
+        Returns:
+            Table with the same values in compact dtypes.
+
+    """
+    return pd.DataFrame(
+        {
+            name: _compact_column(column, downcast_floats, max_category_ratio)
+            for name, column in data.items()
+        },
+        index=data.index,
+    )
@@ -0,0 +1,168 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Join implementations behind ``create_master_table``.
+
+``merge_master_table`` is the straightforward ``DataFrame.merge`` version.
+``hash_join_master_table`` builds a hash index on each join key once, probes
+it with row positions only and gathers the output columns of each input with a
+single ``take``, so none of the intermediate joined frames are materialised.
+"""
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def merge_master_table(
+    shuttles: pd.DataFrame, companies: pd.DataFrame, reviews: pd.DataFrame
+) -> pd.DataFrame:
+    """Combines all data using two successive ``DataFrame.merge`` calls.
+
+        Args:
+            shuttles: Preprocessed data for shuttles.
+            companies: Preprocessed data for companies.
+            reviews: Source data for reviews.
+        Returns:
+            Master table.
+
+    """
+    rated_shuttles = shuttles.merge(reviews, left_on="id", right_on="shuttle_id")
+
+    with_companies = rated_shuttles.merge(
+        companies, left_on="company_id", right_on="id"
+    )
+
+    master_table = with_companies.drop(["shuttle_id", "company_id"], axis=1)
+    master_table = master_table.dropna()
+    return master_table
+
+
+def _valid_rows(data: pd.DataFrame) -> np.ndarray:
+    return np.flatnonzero(data.notna().all(axis=1).to_numpy())
+
+
+class _KeyIndex:
+    """Hash index from join key values to the rows holding them."""
+
+    def __init__(self, keys: np.ndarray, rows: np.ndarray):
+        codes, uniques = pd.factorize(keys)
+        self._uniques = pd.Index(uniques)
+        self._rows = rows[np.argsort(codes, kind="stable")]
+        self._counts = np.bincount(codes, minlength=len(uniques))
+        self._starts = np.cumsum(self._counts) - self._counts
+
+    def probe(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds every match for ``keys``.
+
+        Returns:
+            Positions in ``keys`` and the matching indexed rows, pairwise,
+            in ``keys`` order.
+
+        """
+        codes = self._uniques.get_indexer(keys)
+        positions = np.flatnonzero(codes >= 0)
+        codes = codes[positions]
+        counts = self._counts[codes]
+        total = counts.sum()
+
+        # Offset of each match within its run of equal keys.
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        rows = self._rows[np.repeat(self._starts[codes], counts) + offsets]
+        return np.repeat(positions, counts), rows
+
+
+def _suffixed(left: List[str], right: List[str]) -> Tuple[List[str], List[str]]:
+    # Mirrors the default ``suffixes=("_x", "_y")`` of ``DataFrame.merge``.
+    overlap = set(left) & set(right)
+    return (
+        [f"{name}_x" if name in overlap else name for name in left],
+        [f"{name}_y" if name in overlap else name for name in right],
+    )
+
+
+def hash_join_master_table(
+    shuttles: pd.DataFrame, companies: pd.DataFrame, reviews: pd.DataFrame
+) -> pd.DataFrame:
+    """Combines all data with a hash join on pre-built key indexes.
+
+    Rows containing missing values are excluded from each input before
+    joining, which gives the same rows as dropping them after the joins
+    because an inner join row is complete exactly when all of its source
+    rows are.  Rows come out in ``reviews`` order, which may differ from
+    the order produced by ``merge_master_table``.
+
+        Args:
+            shuttles: Preprocessed data for shuttles.
+            companies: Preprocessed data for companies.
+            reviews: Source data for reviews.
+        Returns:
+            Master table.
+
+    """
+    shuttle_rows = _valid_rows(shuttles)
+    company_rows = _valid_rows(companies)
+    review_rows = _valid_rows(reviews)
+
+    shuttle_index = _KeyIndex(shuttles["id"].to_numpy()[shuttle_rows], shuttle_rows)
+    company_index = _KeyIndex(companies["id"].to_numpy()[company_rows], company_rows)
+
+    positions, shuttle_rows = shuttle_index.probe(
+        reviews["shuttle_id"].to_numpy()[review_rows]
+    )
+    review_rows = review_rows[positions]
+
+    positions, company_rows = company_index.probe(
+        shuttles["company_id"].to_numpy()[shuttle_rows]
+    )
+    review_rows = review_rows[positions]
+    shuttle_rows = shuttle_rows[positions]
+
+    shuttle_names, review_names = _suffixed(
+        list(shuttles.columns), list(reviews.columns)
+    )
+    rated_names, company_names = _suffixed(
+        shuttle_names + review_names, list(companies.columns)
+    )
+    sources = [
+        (shuttles, rated_names[: len(shuttle_names)], shuttle_rows),
+        (reviews, rated_names[len(shuttle_names) :], review_rows),
+        (companies, company_names, company_rows),
+    ]
+
+    parts = []
+    for data, names, rows in sources:
+        keep = [
+            position
+            for position, name in enumerate(names)
+            if name not in ("shuttle_id", "company_id")
+        ]
+        part = data.iloc[rows, keep]
+        part.columns = [names[position] for position in keep]
+        part.index = pd.RangeIndex(len(rows))
+        parts.append(part)
+    return pd.concat(parts, axis=1, copy=False)
@@ -25,21 +25,16 @@
 #
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import pandas as pd
-
-
-def _is_true(x):
-    return x == "t"
-
+import logging
+from typing import Any, Dict, Iterator
 
-def _parse_percentage(x):
-    if isinstance(x, str):
-        return float(x.replace("%", "")) / 100
-    return float("NaN")
+import pandas as pd
 
+from .compaction import compact
+from .joins import hash_join_master_table, merge_master_table
+from .parsing import is_true, parse_money, parse_percentage
 
-def _parse_money(x):
-    return float(x.replace("$", "").replace(",", ""))
+_JOIN_METHODS = {"merge": merge_master_table, "hash": hash_join_master_table}
 
 
 def preprocess_companies(companies: pd.DataFrame) -> pd.DataFrame:
@@ -52,9 +47,9 @@ def preprocess_companies(companies: pd.DataFrame) -> pd.DataFrame:
 
     """
 
-    companies["iata_approved"] = companies["iata_approved"].apply(_is_true)
+    companies["iata_approved"] = is_true(companies["iata_approved"])
 
-    companies["company_rating"] = companies["company_rating"].apply(_parse_percentage)
+    companies["company_rating"] = parse_percentage(companies["company_rating"])
 
     return companies
 
@@ -68,19 +63,80 @@ def preprocess_shuttles(shuttles: pd.DataFrame) -> pd.DataFrame:
             Preprocessed data.
 
     """
-    shuttles["d_check_complete"] = shuttles["d_check_complete"].apply(_is_true)
+    shuttles["d_check_complete"] = is_true(shuttles["d_check_complete"])
 
-    shuttles["moon_clearance_complete"] = shuttles["moon_clearance_complete"].apply(
-        _is_true
-    )
+    shuttles["moon_clearance_complete"] = is_true(shuttles["moon_clearance_complete"])
 
-    shuttles["price"] = shuttles["price"].apply(_parse_money)
+    shuttles["price"] = parse_money(shuttles["price"])
 
     return shuttles
 
 
+def preprocess_companies_chunks(
+    companies: Iterator[pd.DataFrame],
+) -> Iterator[pd.DataFrame]:
+    """Preprocess the data for companies one chunk at a time.
+
+        Args:
+            companies: Chunks of source data.
+        Returns:
+            Lazily preprocessed chunks.
+
+    """
+    return map(preprocess_companies, companies)
+
+
+def preprocess_shuttles_chunks(
+    shuttles: Iterator[pd.DataFrame],
+) -> Iterator[pd.DataFrame]:
+    """Preprocess the data for shuttles one chunk at a time.
+
+        Args:
+            shuttles: Chunks of source data.
+        Returns:
+            Lazily preprocessed chunks.
+
+    """
+    return map(preprocess_shuttles, shuttles)
+
+
+def compact_tables(
+    compaction: Dict[str, Any], **tables: pd.DataFrame
+) -> Dict[str, pd.DataFrame]:
+    """Losslessly converts the columns of each table to compact dtypes and
+    logs the memory used before and after.
+
+        Args:
+            compaction: Parameters defined in parameters.yml: ``enabled``,
+                ``downcast_floats`` and ``max_category_ratio``.
+            tables: Tables to compact, by name.
+        Returns:
+            Compacted tables, by name.
+
+    """
+    if not compaction["enabled"]:
+        return tables
+
+    log = logging.getLogger(__name__)
+    compacted = {}
+    for name, data in tables.items():
+        compacted[name] = compact(
+            data, compaction["downcast_floats"], compaction["max_category_ratio"]
+        )
+        log.info(
+            "Compacted %s from %.1f MiB to %.1f MiB",
+            name,
+            data.memory_usage(deep=True).sum() / 2 ** 20,
+            compacted[name].memory_usage(deep=True).sum() / 2 ** 20,
+        )
+    return compacted
+
+
 def create_master_table(
-    shuttles: pd.DataFrame, companies: pd.DataFrame, reviews: pd.DataFrame
+    shuttles: pd.DataFrame,
+    companies: pd.DataFrame,
+    reviews: pd.DataFrame,
+    join_method: str = "merge",
 ) -> pd.DataFrame:
     """Combines all data to create a master table.
 
@@ -88,16 +144,17 @@ def create_master_table(
             shuttles: Preprocessed data for shuttles.
             companies: Preprocessed data for companies.
             reviews: Source data for reviews.
+            join_method: Either ``"merge"`` for successive ``DataFrame.merge``
+                calls or ``"hash"`` for a hash join on pre-built key indexes.
         Returns:
             Master table.
+        Raises:
+            ValueError: When ``join_method`` is not recognised.
 
     """
-    rated_shuttles = shuttles.merge(reviews, left_on="id", right_on="shuttle_id")
-
-    with_companies = rated_shuttles.merge(
-        companies, left_on="company_id", right_on="id"
-    )
-
-    master_table = with_companies.drop(["shuttle_id", "company_id"], axis=1)
-    master_table = master_table.dropna()
-    return master_table
+    if join_method not in _JOIN_METHODS:
+        raise ValueError(
+            f"Unknown join method `{join_method}`, "
+            f"expected one of {sorted(_JOIN_METHODS)}"
+        )
+    return _JOIN_METHODS[join_method](shuttles, companies, reviews)
@@ -0,0 +1,134 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Out-of-core ``create_master_table`` for inputs larger than memory.
+
+The inputs arrive as iterators of chunks and are hash-partitioned by join key
+into spill files on disk.  Each pair of partitions is then small enough to be
+joined in memory, one at a time:
+
+1. shuttles and reviews are partitioned by shuttle id and joined, and each
+   joined partition is re-partitioned by company id;
+2. companies are partitioned by company id and joined with the rated shuttles
+   partition by partition, producing one master table partition each.
+"""
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _buckets(keys: pd.Series, num_partitions: int) -> np.ndarray:
+    # Keys are hashed as floats, so that an id hashes alike whether it was
+    # parsed as an integer or, in a chunk with missing values, as a float.
+    hashes = pd.util.hash_array(keys.to_numpy(dtype="float64"))
+    return hashes % np.uint64(num_partitions)
+
+
+def _spill_chunk(
+    chunk: pd.DataFrame, key: str, path: Path, num_partitions: int, name: str
+) -> None:
+    # Incomplete rows never reach the master table, see ``joins``.
+    chunk = chunk.dropna()
+    for bucket, part in chunk.groupby(_buckets(chunk[key], num_partitions)):
+        bucket_path = path / str(bucket)
+        bucket_path.mkdir(parents=True, exist_ok=True)
+        part.to_pickle(bucket_path / f"{name}.pkl")
+
+
+def _spill(
+    chunks: Iterable[pd.DataFrame], key: str, path: Path, num_partitions: int
+) -> None:
+    for number, chunk in enumerate(chunks):
+        _spill_chunk(chunk, key, path, num_partitions, str(number))
+
+
+def _read_bucket(path: Path, bucket: int) -> Optional[pd.DataFrame]:
+    files = sorted((path / str(bucket)).glob("*.pkl"))
+    if not files:
+        return None
+    return pd.concat([pd.read_pickle(file) for file in files], ignore_index=True)
+
+
+def create_master_table_partitions(
+    shuttles: Iterable[pd.DataFrame],
+    companies: Iterable[pd.DataFrame],
+    reviews: Iterable[pd.DataFrame],
+    partitioning: Dict[str, Any],
+) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """Combines all data into a partitioned master table, out of core.
+
+        Args:
+            shuttles: Chunks of preprocessed data for shuttles.
+            companies: Chunks of preprocessed data for companies.
+            reviews: Chunks of source data for reviews.
+            partitioning: ``num_partitions``, the number of hash partitions,
+                which should be large enough for one partition of each input
+                to fit in memory, and optionally ``spill_dir``, the directory
+                for temporary spill files (the system default if missing).
+        Returns:
+            Lazily computed ``(partition_id, master_table_partition)`` pairs.
+            Together they hold the rows of ``create_master_table``.
+
+    """
+    num_partitions = partitioning["num_partitions"]
+
+    with tempfile.TemporaryDirectory(dir=partitioning.get("spill_dir")) as spill:
+        spill = Path(spill)
+        _spill(shuttles, "id", spill / "shuttles", num_partitions)
+        _spill(reviews, "shuttle_id", spill / "reviews", num_partitions)
+        _spill(companies, "id", spill / "companies", num_partitions)
+
+        for bucket in range(num_partitions):
+            shuttles_part = _read_bucket(spill / "shuttles", bucket)
+            reviews_part = _read_bucket(spill / "reviews", bucket)
+            if shuttles_part is None or reviews_part is None:
+                continue
+            rated_shuttles = shuttles_part.merge(
+                reviews_part, left_on="id", right_on="shuttle_id"
+            )
+            _spill_chunk(
+                rated_shuttles,
+                "company_id",
+                spill / "rated",
+                num_partitions,
+                str(bucket),
+            )
+
+        for bucket in range(num_partitions):
+            rated_part = _read_bucket(spill / "rated", bucket)
+            companies_part = _read_bucket(spill / "companies", bucket)
+            if rated_part is None or companies_part is None:
+                continue
+            with_companies = rated_part.merge(
+                companies_part, left_on="company_id", right_on="id"
+            )
+            master_table = with_companies.drop(["shuttle_id", "company_id"], axis=1)
+            if not master_table.empty:
+                yield f"part-{bucket:05d}", master_table
@@ -0,0 +1,100 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Vectorised parsers for the raw spaceflight columns.
+
+The raw columns hold few distinct values, so each parser factorises its
+column, parses only the unique strings through the pandas string accessor
+and broadcasts the result back with a NumPy take.  This avoids the per-row
+Python call of ``Series.apply``.
+"""
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+def _parse_uniques(
+    series: pd.Series, parse: Callable[[pd.Series], pd.Series]
+) -> pd.Series:
+    codes, uniques = pd.factorize(series)
+    parsed = parse(pd.Series(uniques, dtype=object)).to_numpy(dtype=float)
+    # Missing values are coded as -1, which picks up the trailing NaN.
+    values = np.append(parsed, np.nan)[codes]
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _percentage_to_float(uniques: pd.Series) -> pd.Series:
+    return uniques.str.replace("%", "", regex=False).astype(float) / 100
+
+
+def _money_to_float(uniques: pd.Series) -> pd.Series:
+    return (
+        uniques.str.replace("$", "", regex=False)
+        .str.replace(",", "", regex=False)
+        .astype(float)
+    )
+
+
+def is_true(series: pd.Series) -> pd.Series:
+    """Parses a ``"t"``/``"f"`` flag column into booleans.
+
+        Args:
+            series: Raw flag values.
+        Returns:
+            ``True`` where the value is ``"t"``, ``False`` otherwise (including
+            missing values).  Columns already loaded as booleans are kept,
+            with missing values set to ``False``.
+
+    """
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return series.fillna(False).astype(bool)
+    return series == "t"
+
+
+def parse_percentage(series: pd.Series) -> pd.Series:
+    """Parses a ``"NN%"`` column into fractions.
+
+        Args:
+            series: Raw percentage strings.
+        Returns:
+            Float fractions; any value that is not a string becomes ``NaN``.
+
+    """
+    return _parse_uniques(series, _percentage_to_float)
+
+
+def parse_money(series: pd.Series) -> pd.Series:
+    """Parses a ``"$1,234.5"`` column into floats.
+
+        Args:
+            series: Raw money strings.
+        Returns:
+            Float amounts; missing values stay ``NaN``.
+
+    """
+    return _parse_uniques(series, _money_to_float)
@@ -27,28 +27,117 @@
 # limitations under the License.
 from kedro.pipeline import Pipeline, node
 
-from .nodes import create_master_table, preprocess_companies, preprocess_shuttles
+from .nodes import (
+    compact_tables,
+    create_master_table,
+    preprocess_companies,
+    preprocess_companies_chunks,
+    preprocess_shuttles,
+    preprocess_shuttles_chunks,
+)
+from .out_of_core import create_master_table_partitions
+
+
+def _master_table_pipeline(
+    reviews: str = "reviews", master_table: str = "master_table@pandas"
+):
+    return Pipeline(
+        [
+            node(
+                func=compact_tables,
+                inputs={
+                    "compaction": "params:dtype_compaction",
+                    "shuttles": "preprocessed_shuttles@pandas",
+                    "companies": "preprocessed_companies@pandas",
+                },
+                outputs={
+                    "shuttles": "compacted_shuttles",
+                    "companies": "compacted_companies",
+                },
+                name="compacting_tables",
+            ),
+            node(
+                func=create_master_table,
+                inputs=[
+                    "compacted_shuttles",
+                    "compacted_companies",
+                    reviews,
+                    "params:master_table_join",
+                ],
+                outputs=master_table,
+            ),
+        ]
+    )
 
 
 def create_pipeline(**kwargs):
+    return (
+        Pipeline(
+            [
+                node(
+                    func=preprocess_companies,
+                    inputs="companies",
+                    outputs="preprocessed_companies@pandas",
+                    name="preprocessing_companies",
+                ),
+                node(
+                    func=preprocess_shuttles,
+                    inputs="shuttles",
+                    outputs="preprocessed_shuttles@pandas",
+                    name="preprocessing_shuttles",
+                ),
+            ]
+        )
+        + _master_table_pipeline()
+    )
+
+
+def _chunked_preprocessing_pipeline():
     return Pipeline(
         [
             node(
-                func=preprocess_companies,
-                inputs="companies",
-                outputs="preprocessed_companies",
+                func=preprocess_companies_chunks,
+                inputs="companies@chunked",
+                outputs="preprocessed_companies@chunked",
                 name="preprocessing_companies",
             ),
             node(
-                func=preprocess_shuttles,
-                inputs="shuttles",
-                outputs="preprocessed_shuttles",
+                func=preprocess_shuttles_chunks,
+                inputs="shuttles@chunked",
+                outputs="preprocessed_shuttles@chunked",
                 name="preprocessing_shuttles",
             ),
+        ]
+    )
+
+
+def create_streaming_pipeline(**kwargs):
+    return _chunked_preprocessing_pipeline() + _master_table_pipeline()
+
+
+def create_incremental_pipeline(**kwargs):
+    """Append the reviews added since the last build to the master table.
+
+    Reuses the preprocessed companies and shuttles of an earlier full run,
+    which must be rerun if either of them changes.
+    """
+    return _master_table_pipeline(
+        reviews="reviews@incremental", master_table="master_table@incremental"
+    )
+
+
+def create_out_of_core_pipeline(**kwargs):
+    return _chunked_preprocessing_pipeline() + Pipeline(
+        [
             node(
-                func=create_master_table,
-                inputs=["preprocessed_shuttles", "preprocessed_companies", "reviews"],
-                outputs="master_table",
+                func=create_master_table_partitions,
+                inputs=[
+                    "preprocessed_shuttles@chunked",
+                    "preprocessed_companies@chunked",
+                    "reviews@chunked",
+                    "params:master_table_partitioning",
+                ],
+                outputs="master_table_partitions",
             ),
         ]
     )
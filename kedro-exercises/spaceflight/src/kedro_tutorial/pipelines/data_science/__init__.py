@@ -1 +1,5 @@
-from .pipeline import create_pipeline  # NOQA
+from .pipeline import (  # NOQA
+    create_cross_validation_pipeline,
+    create_pipeline,
+    create_sweep_pipeline,
+)
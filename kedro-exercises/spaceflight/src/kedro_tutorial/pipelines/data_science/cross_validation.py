@@ -0,0 +1,130 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""K-fold cross-validation behind the ``ds_cv`` pipeline.
+
+The features are gathered into one buffer and the fold indexes computed
+once.  Folds are fit and evaluated in a ``joblib`` process pool, which
+memory-maps the buffer once and shares it with all workers; each worker
+only gathers the rows of its own fold.
+"""
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.model_selection import KFold
+
+from .metrics import MetricRegistry, row_chunks
+from .nodes import EVALUATION_CHUNK_SIZE, FEATURES, TARGET, gather_columns, train_model
+
+
+def split_folds(data: pd.DataFrame, cross_validation: Dict[str, Any]) -> List:
+    """Gathers the features once and splits the rows into k folds.
+
+        Args:
+            data: Source data.
+            cross_validation: ``n_splits``, and the ``shuffle`` and
+                ``random_state`` of ``KFold``.
+        Returns:
+            A list containing the features, the price and the training and
+            testing row indexes of every fold.
+
+    """
+    order = np.arange(len(data))
+    X = gather_columns(data, FEATURES, order)
+    y = gather_columns(data, [TARGET], order)[:, 0]
+    folds = list(
+        KFold(
+            n_splits=cross_validation["n_splits"],
+            shuffle=cross_validation["shuffle"],
+            random_state=cross_validation["random_state"],
+        ).split(X)
+    )
+    return [X, y, folds]
+
+
+def _fit_and_evaluate_fold(
+    X: np.ndarray,
+    y: np.ndarray,
+    train: np.ndarray,
+    test: np.ndarray,
+    training: Dict[str, Any],
+    metrics: List[str],
+) -> Dict[str, Dict[str, float]]:
+    X_train, y_train = X[train], y[train]
+    regressor = train_model(X_train, y_train, training)
+    registry = MetricRegistry(metrics)
+    return {
+        "Train": registry.evaluate(
+            regressor, row_chunks(X_train, y_train, EVALUATION_CHUNK_SIZE)
+        ),
+        "Test": registry.evaluate(
+            regressor, row_chunks(X[test], y[test], EVALUATION_CHUNK_SIZE)
+        ),
+    }
+
+
+def cross_validate_model(
+    X: np.ndarray,
+    y: np.ndarray,
+    folds: List[Tuple[np.ndarray, np.ndarray]],
+    cross_validation: Dict[str, Any],
+    training: Dict[str, Any],
+    metrics: List[str],
+) -> pd.DataFrame:
+    """Trains and evaluates the model on every fold in parallel.
+
+        Args:
+            X: Independent features of all rows.
+            y: Price of all rows.
+            folds: Training and testing row indexes of every fold.
+            cross_validation: The number of processes ``n_jobs``.
+            training: Training mode, as for ``train_model``.
+            metrics: Import paths of the metric functions.
+        Returns:
+            The mean and standard deviation over the folds of the metrics,
+            indexed by name, for the training and testing data.
+
+    """
+    scores = Parallel(n_jobs=cross_validation["n_jobs"])(
+        delayed(_fit_and_evaluate_fold)(X, y, train, test, training, metrics)
+        for train, test in folds
+    )
+    per_fold = pd.concat(
+        {
+            split: pd.DataFrame([fold[split] for fold in scores])
+            for split in ("Train", "Test")
+        },
+        axis=1,
+    )
+    results = per_fold.agg(["mean", "std"]).T.unstack(level=0)
+    results.columns = [f"{split} {stat}" for stat, split in results.columns]
+    results.index.name = "Metric"
+    return results[
+        [f"{split} {stat}" for split in ("Train", "Test") for stat in ("mean", "std")]
+    ]
@@ -0,0 +1,186 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Out-of-core least squares behind the ``out_of_core`` mode of ``train_model``.
+
+Each chunk of rows is reduced to its sufficient statistics: the row count,
+the feature and target means and the centred cross products ``X^T X`` and
+``X^T y``.  Statistics of chunks are merged with Chan et al.'s pairwise
+update, in any order and in any process, and solve the same centred
+least-squares problem as ``LinearRegression``.
+
+Memory-mapped arrays, e.g. loaded by ``NpyLocalDataSet``, are only read a
+chunk at a time, and worker processes map the rows of their chunks from
+the file instead of receiving a copy of them.
+"""
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union
+
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+
+class SufficientStatistics:
+    """Sufficient statistics of the rows seen so far for an ordinary least
+    squares fit with intercept.
+    """
+
+    def __init__(self, n_features: int):
+        self.count = 0
+        self.mean = np.zeros(n_features + 1)
+        self.cross = np.zeros((n_features + 1, n_features + 1))
+
+    @classmethod
+    def of(cls, X: np.ndarray, y: np.ndarray) -> "SufficientStatistics":
+        """Computes the statistics of one chunk of rows."""
+        data = np.column_stack([X, y]).astype(np.float64, copy=False)
+        statistics = cls(data.shape[1] - 1)
+        statistics.count = len(data)
+        if statistics.count:
+            statistics.mean = data.mean(axis=0)
+            centred = data - statistics.mean
+            statistics.cross = centred.T @ centred
+        return statistics
+
+    def merge(self, other: "SufficientStatistics") -> "SufficientStatistics":
+        """Adds the statistics of ``other``, e.g. of another chunk, in place."""
+        total = self.count + other.count
+        if not other.count:
+            return self
+        delta = other.mean - self.mean
+        self.cross = (
+            self.cross
+            + other.cross
+            + np.outer(delta, delta) * self.count * other.count / total
+        )
+        self.mean = self.mean + delta * other.count / total
+        self.count = total
+        return self
+
+    def solve(self) -> LinearRegression:
+        """Solves the least-squares problem of the rows seen so far.
+
+            Returns:
+                A fitted ``LinearRegression``, as if fit on all the rows.
+
+        """
+        xx, xy = self.cross[:-1, :-1], self.cross[:-1, -1]
+        coef = np.linalg.lstsq(xx, xy, rcond=None)[0]
+
+        regressor = LinearRegression()
+        regressor.coef_ = coef
+        regressor.intercept_ = self.mean[-1] - self.mean[:-1] @ coef
+        regressor.n_features_in_ = len(coef)
+        return regressor
+
+
+class _MappedRows:
+    """Rows of a memory-mapped array, sent to worker processes in place of a
+    copy of the rows.
+    """
+
+    def __init__(self, array: np.memmap, start: int, stop: int):
+        row_nbytes = array.itemsize * int(np.prod(array.shape[1:]))
+        self.filename = array.filename
+        self.dtype = array.dtype
+        self.offset = array.offset + start * row_nbytes
+        self.shape = (stop - start, *array.shape[1:])
+
+    def load(self) -> np.ndarray:
+        return np.memmap(
+            self.filename, self.dtype, "r", offset=self.offset, shape=self.shape
+        )
+
+
+def _rows(array: np.ndarray, start: int, stop: int) -> Union[np.ndarray, _MappedRows]:
+    stop = min(stop, len(array))
+    if (
+        isinstance(array, np.memmap)
+        and isinstance(array.base, mmap.mmap)
+        and array.flags.c_contiguous
+    ):
+        return _MappedRows(array, start, stop)
+    return array[start:stop]
+
+
+def _statistics_of(
+    X: Union[np.ndarray, _MappedRows], y: Union[np.ndarray, _MappedRows]
+) -> SufficientStatistics:
+    return SufficientStatistics.of(
+        *(rows.load() if isinstance(rows, _MappedRows) else rows for rows in (X, y))
+    )
+
+
+def fit_least_squares(
+    X: np.ndarray, y: np.ndarray, chunk_size: int, n_jobs: int = 1
+) -> LinearRegression:
+    """Fits an ordinary least squares regression one chunk of rows at a time.
+
+        Args:
+            X: Independent features, e.g. a memory-mapped array.
+            y: Targets, e.g. a memory-mapped array.
+            chunk_size: Number of rows reduced to their statistics at a time.
+            n_jobs: Number of processes reducing chunks to their statistics.
+                As in joblib, negative values count back from the number of
+                CPUs, so -1 uses all of them. At most two chunks per process
+                are in flight at a time.
+        Returns:
+            A fitted ``LinearRegression``.
+        Raises:
+            ValueError: When ``n_jobs`` is 0.
+
+    """
+    if n_jobs == 0:
+        raise ValueError("`n_jobs` must be a positive or negative integer, not 0.")
+    if n_jobs < 0:
+        n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+
+    statistics = SufficientStatistics(X.shape[1])
+    starts = range(0, len(y), chunk_size)
+    if n_jobs == 1:
+        for start in starts:
+            stop = start + chunk_size
+            statistics.merge(_statistics_of(X[start:stop], y[start:stop]))
+        return statistics.solve()
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        pending = deque()
+        for start in starts:
+            stop = start + chunk_size
+            if len(pending) == 2 * n_jobs:
+                statistics.merge(pending.popleft().result())
+            pending.append(
+                executor.submit(
+                    _statistics_of, _rows(X, start, stop), _rows(y, start, stop)
+                )
+            )
+        while pending:
+            statistics.merge(pending.popleft().result())
+    return statistics.solve()
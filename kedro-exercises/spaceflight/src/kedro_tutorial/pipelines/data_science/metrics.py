@@ -0,0 +1,161 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Metric registry behind ``evaluate_model``.
+
+Metrics are resolved from their import paths once per process.  The common
+regression metrics are computed from running moments of the targets and of
+the residuals, which are merged chunk by chunk, so predictions never need to
+be held in memory all at once.  Any other metric is called once on the
+concatenated targets and predictions.
+"""
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+from kedro.utils import load_obj
+from sklearn.metrics import (
+    explained_variance_score,
+    mean_absolute_error,
+    mean_squared_error,
+    r2_score,
+)
+
+_load_metric = lru_cache(maxsize=None)(load_obj)
+
+
+class _Moments:
+    """Count, mean and sum of squared deviations of the targets and of the
+    residuals, plus the sum of absolute residuals, merged chunk by chunk
+    with Chan et al.'s pairwise update.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = np.zeros(2)
+        self.m2 = np.zeros(2)
+        self.absolute_error = 0.0
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        values = np.stack([y_true, y_true - y_pred]).astype(np.float64)
+        count = values.shape[1]
+        if not count:
+            return
+        mean = values.mean(axis=1)
+        m2 = np.square(values - mean[:, None]).sum(axis=1)
+
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * count / total
+        self.m2 = self.m2 + m2 + np.square(delta) * self.count * count / total
+        self.count = total
+        self.absolute_error += np.abs(values[1]).sum()
+
+    @property
+    def squared_error(self) -> float:
+        return self.m2[1] + self.count * self.mean[1] ** 2
+
+    def score(self, residual: float) -> float:
+        """``1 - residual / m2`` of the targets, defined as in scikit-learn
+        when the targets are constant.
+        """
+        if self.m2[0] == 0:
+            return 1.0 if residual == 0 else 0.0
+        return 1 - residual / self.m2[0]
+
+
+_FROM_MOMENTS: Dict[Callable, Callable[[_Moments], float]] = {
+    r2_score: lambda moments: moments.score(moments.squared_error),
+    explained_variance_score: lambda moments: moments.score(moments.m2[1]),
+    mean_squared_error: lambda moments: moments.squared_error / moments.count,
+    mean_absolute_error: lambda moments: moments.absolute_error / moments.count,
+}
+
+
+class MetricRegistry:
+    """Resolves metrics from their import paths, e.g.
+    ``sklearn.metrics.r2_score``, and evaluates all of them in one pass over
+    the predictions.
+
+    Example:
+    ::
+
+        >>> registry = MetricRegistry(["sklearn.metrics.r2_score"])
+        >>> registry.evaluate(regressor, [(X_test, y_test)])
+        {'r2_score': 0.47}
+
+    """
+
+    def __init__(self, metrics: Iterable[str]):
+        self._metrics = {
+            metric.rpartition(".")[2]: _load_metric(metric) for metric in metrics
+        }
+
+    def evaluate(
+        self, regressor, chunks: Iterable[Tuple[np.ndarray, np.ndarray]]
+    ) -> Dict[str, float]:
+        """Evaluates the metrics on the predictions of ``regressor``.
+
+            Args:
+                regressor: Trained model.
+                chunks: Pairs of independent features and targets, e.g.
+                    consecutive row ranges of a test set.
+            Returns:
+                A mapping from metric name to value.
+
+        """
+        moments = _Moments()
+        needs_arrays = any(
+            metric not in _FROM_MOMENTS for metric in self._metrics.values()
+        )
+        y_true: List[np.ndarray] = []
+        y_pred: List[np.ndarray] = []
+        for X, y in chunks:
+            prediction = regressor.predict(X)
+            moments.update(y, prediction)
+            if needs_arrays:
+                y_true.append(y)
+                y_pred.append(prediction)
+
+        if needs_arrays:
+            y_true_all = np.concatenate(y_true)
+            y_pred_all = np.concatenate(y_pred)
+        return {
+            name: _FROM_MOMENTS[metric](moments)
+            if metric in _FROM_MOMENTS
+            else metric(y_true_all, y_pred_all)
+            for name, metric in self._metrics.items()
+        }
+
+
+def row_chunks(
+    X: np.ndarray, y: np.ndarray, chunk_size: int
+) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+    """Splits features and targets into consecutive row ranges, as views."""
+    for start in range(0, len(y), chunk_size):
+        stop = start + chunk_size
+        yield X[start:stop], y[start:stop]
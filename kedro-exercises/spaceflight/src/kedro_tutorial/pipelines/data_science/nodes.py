@@ -30,14 +30,44 @@ from typing import Dict, List
 
 import numpy as np
 import pandas as pd
-from kedro.utils import load_obj
 from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import ShuffleSplit
+
+from .least_squares import fit_least_squares
+from .metrics import MetricRegistry, row_chunks
+
+# Rows predicted at a time while evaluating, to bound the predictions in memory.
+EVALUATION_CHUNK_SIZE = 100_000
+
+FEATURES = [
+    "engines",
+    "passenger_capacity",
+    "crew",
+    "d_check_complete",
+    "moon_clearance_complete",
+]
+TARGET = "price"
+
+
+def gather_columns(
+    data: pd.DataFrame, columns: List[str], order: np.ndarray
+) -> np.ndarray:
+    """Copies ``columns`` into one C-contiguous float64 array, one column at
+    a time, with the rows in ``order``.
+    """
+    gathered = np.empty((len(order), len(columns)), dtype=np.float64)
+    for j, column in enumerate(columns):
+        gathered[:, j] = data[column].to_numpy(dtype=np.float64)[order]
+    return gathered
 
 
 def split_data(data: pd.DataFrame, parameters: Dict) -> List:
     """Splits data into training and test sets.
 
+    The features are copied once, into a single buffer holding the training
+    rows followed by the testing rows, so the training and test sets are
+    views of it.  The split is the same as ``train_test_split``'s.
+
         Args:
             data: Source data.
             parameters: Parameters defined in parameters.yml.
@@ -45,34 +75,52 @@ def split_data(data: pd.DataFrame, parameters: Dict) -> List:
             A list containing split data.
 
     """
-    X = data[
-        [
-            "engines",
-            "passenger_capacity",
-            "crew",
-            "d_check_complete",
-            "moon_clearance_complete",
-        ]
-    ].values
-    y = data["price"].values
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=parameters["test_size"], random_state=parameters["random_state"]
+    train, test = next(
+        ShuffleSplit(
+            n_splits=1,
+            test_size=parameters["test_size"],
+            random_state=parameters["random_state"],
+        ).split(np.empty((len(data), 0)))
     )
+    order = np.concatenate([train, test])
+    X = gather_columns(data, FEATURES, order)
+    y = gather_columns(data, [TARGET], order)[:, 0]
 
-    return [X_train, X_test, y_train, y_test]
+    n_train = len(train)
+    return [X[:n_train], X[n_train:], y[:n_train], y[n_train:]]
 
 
-def train_model(X_train: np.ndarray, y_train: np.ndarray) -> LinearRegression:
+def train_model(
+    X_train: np.ndarray, y_train: np.ndarray, training: Dict
+) -> LinearRegression:
     """Train the linear regression model.
 
+    In the ``out_of_core`` mode, the model is fit one chunk of rows at a
+    time from the sufficient statistics of the chunks, so ``X_train`` and
+    ``y_train`` can be memory-mapped arrays larger than memory.
+
         Args:
             X_train: Training data of independent features.
             y_train: Training data for price.
+            training: Training mode (``in_memory`` or ``out_of_core``), and
+                the ``chunk_size`` and ``n_jobs`` of the ``out_of_core`` mode.
 
         Returns:
             Trained model.
+        Raises:
+            ValueError: When the training mode is not recognised.
 
     """
+    if training["mode"] == "out_of_core":
+        return fit_least_squares(
+            X_train, y_train, training["chunk_size"], n_jobs=training["n_jobs"]
+        )
+    if training["mode"] != "in_memory":
+        raise ValueError(
+            f"Unknown training mode `{training['mode']}`, "
+            "expected one of ['in_memory', 'out_of_core']"
+        )
+
     regressor = LinearRegression()
     regressor.fit(X_train, y_train)
     return regressor
@@ -86,23 +134,29 @@ def evaluate_model(
     y_test: np.ndarray,
     metrics: List[str],
 ):
-    """Calculate the coefficient of determination and log the result.
+    """Calculate the metrics on the training and testing data.
 
         Args:
             regressor: Trained model.
+            X_train: Training data of independent features.
+            y_train: Training data for price.
             X_test: Testing data of independent features.
             y_test: Testing data for price.
+            metrics: Import paths of the metric functions.
+        Returns:
+            The metrics, indexed by name, for the training and testing data.
 
     """
-    y_train_pred = regressor.predict(X_train)
-    y_test_pred = regressor.predict(X_test)
-    results = []
-    for metric in metrics:
-        results.append(
-            {
-                "Metric": metric.rpartition(".")[2],
-                "Train": load_obj(metric)(y_train, y_train_pred),
-                "Test": load_obj(metric)(y_test, y_test_pred),
-            }
-        )
-    return pd.DataFrame(results).set_index("Metric")
+    registry = MetricRegistry(metrics)
+    results = pd.DataFrame(
+        {
+            "Train": registry.evaluate(
+                regressor, row_chunks(X_train, y_train, EVALUATION_CHUNK_SIZE)
+            ),
+            "Test": registry.evaluate(
+                regressor, row_chunks(X_test, y_test, EVALUATION_CHUNK_SIZE)
+            ),
+        }
+    )
+    results.index.name = "Metric"
+    return results
@@ -27,18 +27,31 @@
 # limitations under the License.
 from kedro.pipeline import Pipeline, node
 
+from .cross_validation import cross_validate_model, split_folds
 from .nodes import evaluate_model, split_data, train_model
+from .sweep import sweep_models
 
 
-def create_pipeline(**kwargs):
+def _split_pipeline():
     return Pipeline(
         [
             node(
                 func=split_data,
-                inputs=["master_table", "parameters"],
+                inputs=["master_table@features", "parameters"],
                 outputs=["X_train", "X_test", "y_train", "y_test"],
+            )
+        ]
+    )
+
+
+def create_pipeline(**kwargs):
+    return _split_pipeline() + Pipeline(
+        [
+            node(
+                func=train_model,
+                inputs=["X_train", "y_train", "params:training"],
+                outputs="regressor",
             ),
-            node(func=train_model, inputs=["X_train", "y_train"], outputs="regressor"),
             node(
                 func=evaluate_model,
                 inputs=[
@@ -53,3 +66,46 @@ def create_pipeline(**kwargs):
             ),
         ]
     )
+
+
+def create_sweep_pipeline(**kwargs):
+    return _split_pipeline() + Pipeline(
+        [
+            node(
+                func=sweep_models,
+                inputs=[
+                    "X_train",
+                    "X_test",
+                    "y_train",
+                    "y_test",
+                    "params:model_sweep",
+                    "params:metrics",
+                ],
+                outputs="model_sweep_metrics",
+            )
+        ]
+    )
+
+
+def create_cross_validation_pipeline(**kwargs):
+    return Pipeline(
+        [
+            node(
+                func=split_folds,
+                inputs=["master_table@features", "params:cross_validation"],
+                outputs=["X", "y", "folds"],
+            ),
+            node(
+                func=cross_validate_model,
+                inputs=[
+                    "X",
+                    "y",
+                    "folds",
+                    "params:cross_validation",
+                    "params:training",
+                    "params:metrics",
+                ],
+                outputs="cross_validation_metrics",
+            ),
+        ]
+    )
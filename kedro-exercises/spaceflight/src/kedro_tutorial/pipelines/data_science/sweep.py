@@ -0,0 +1,128 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Model sweep behind the ``ds_sweep`` pipeline.
+
+Every combination of a candidate's parameter grid is fit and evaluated in a
+``joblib`` process pool.  ``joblib`` memory-maps the split arrays once and
+shares them with all workers instead of pickling them for each candidate.
+"""
+import json
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from kedro.utils import load_obj
+from sklearn.model_selection import ParameterGrid
+
+from .metrics import MetricRegistry, row_chunks
+from .nodes import EVALUATION_CHUNK_SIZE
+
+
+def _expand(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {"candidate": candidate["name"], "model": candidate["model"], "params": params}
+        for candidate in candidates
+        for params in ParameterGrid(candidate.get("grid", {}))
+    ]
+
+
+def _fit_and_evaluate(
+    model: str,
+    params: Dict[str, Any],
+    X_train: np.ndarray,
+    X_test: np.ndarray,
+    y_train: np.ndarray,
+    y_test: np.ndarray,
+    metrics: List[str],
+) -> Dict[str, float]:
+    regressor = load_obj(model)(**params).fit(X_train, y_train)
+    registry = MetricRegistry(metrics)
+    results = {}
+    for split, X, y in (("train", X_train, y_train), ("test", X_test, y_test)):
+        scores = registry.evaluate(regressor, row_chunks(X, y, EVALUATION_CHUNK_SIZE))
+        results.update({f"{split}_{name}": score for name, score in scores.items()})
+    return results
+
+
+def sweep_models(
+    X_train: np.ndarray,
+    X_test: np.ndarray,
+    y_train: np.ndarray,
+    y_test: np.ndarray,
+    sweep: Dict[str, Any],
+    metrics: List[str],
+) -> pd.DataFrame:
+    """Fits and evaluates every candidate model of the sweep in parallel.
+
+        Args:
+            X_train: Training data of independent features.
+            X_test: Testing data of independent features.
+            y_train: Training data for price.
+            y_test: Testing data for price.
+            sweep: Candidates, each with a ``name``, the import path of a
+                ``model`` class and a ``grid`` of its parameters, the
+                number of processes ``n_jobs``, and the testing metric to
+                rank by, ``rank_by``, and whether ``greater_is_better``.
+            metrics: Import paths of the metric functions.
+        Returns:
+            The metrics of every candidate, best first.
+
+    """
+    candidates = _expand(sweep["candidates"])
+    scores = Parallel(n_jobs=sweep["n_jobs"])(
+        delayed(_fit_and_evaluate)(
+            candidate["model"],
+            candidate["params"],
+            X_train,
+            X_test,
+            y_train,
+            y_test,
+            metrics,
+        )
+        for candidate in candidates
+    )
+
+    table = pd.DataFrame(
+        [
+            {
+                "candidate": candidate["candidate"],
+                "model": candidate["model"],
+                "params": json.dumps(candidate["params"], sort_keys=True),
+                **score,
+            }
+            for candidate, score in zip(candidates, scores)
+        ]
+    )
+    table = table.sort_values(
+        f"test_{sweep['rank_by']}",
+        ascending=not sweep["greater_is_better"],
+        kind="mergesort",
+    ).reset_index(drop=True)
+    table.insert(0, "rank", np.arange(1, len(table) + 1))
+    return table
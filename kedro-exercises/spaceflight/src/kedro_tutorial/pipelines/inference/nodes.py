@@ -0,0 +1,102 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+from kedro_tutorial.pipelines.data_engineering.parsing import is_true
+from kedro_tutorial.pipelines.data_science.nodes import FEATURES, gather_columns
+
+FLAGS = ("d_check_complete", "moon_clearance_complete")
+
+
+def predict_price(regressor: LinearRegression, shuttles: pd.DataFrame) -> np.ndarray:
+    """Predict the price of shuttles.
+
+        Args:
+            regressor: Trained model.
+            shuttles: Shuttles with the raw ``t``/``f`` flags of the source
+                data.
+        Returns:
+            The price of every shuttle, missing for the shuttles with
+            missing features.
+
+    """
+    features = shuttles[FEATURES].copy()
+    for column in FLAGS:
+        features[column] = is_true(features[column])
+    X = gather_columns(features, FEATURES, np.arange(len(features)))
+    complete = np.isfinite(X).all(axis=1)
+    price = np.full(len(X), np.nan)
+    if complete.any():
+        price[complete] = regressor.predict(X[complete])
+    return price
+
+
+def _predict(regressor: LinearRegression, shuttles: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"id": shuttles["id"].to_numpy(), "price": predict_price(regressor, shuttles)}
+    )
+
+
+def _log_throughput(predictions: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    rows = 0
+    start = time.perf_counter()
+    for chunk in predictions:
+        rows += len(chunk)
+        yield chunk
+    elapsed = time.perf_counter() - start
+    logging.getLogger(__name__).info(
+        "Scored %d shuttles in %.1f s (%.0f rows/s)",
+        rows,
+        elapsed,
+        rows / elapsed if elapsed else float("inf"),
+    )
+
+
+def predict_prices(
+    regressor: LinearRegression, shuttles: Iterator[pd.DataFrame]
+) -> Iterator[pd.DataFrame]:
+    """Predict the price of the shuttles one chunk at a time.
+
+        Args:
+            regressor: Trained model.
+            shuttles: Chunks of the shuttles feed, with the raw ``t``/``f``
+                flags of the source data.
+        Returns:
+            Lazily predicted chunks of shuttle ids and prices, missing for
+            the shuttles with missing features.  The rate of scoring is
+            logged once all chunks have been consumed.
+
+    """
+    return _log_throughput(_predict(regressor, chunk) for chunk in shuttles)
@@ -27,10 +27,14 @@
 # limitations under the License.
 
 """Application entry point."""
+import argparse
+import logging
 from pathlib import Path
 
 from kedro.context import KedroContext, load_context
 
+from kedro_tutorial.serve import make_server
+
 
 class ProjectContext(KedroContext):
     """Users can override the remaining methods from the parent class here,
@@ -45,6 +49,36 @@ def run_package():
     project_context.run()
 
 
+def serve_package(args=None):
+    # entry point for serving predictions of the trained regressor
+    # using `<project_package>-serve` command
+    parser = argparse.ArgumentParser(
+        description="Serve price predictions of the trained regressor."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--socket", help="Listen on this Unix socket instead.")
+    parser.add_argument("--regressor-version", help="Defaults to the latest.")
+    parser.add_argument("--max-batch-size", type=int, default=1024)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    options = parser.parse_args(args)
+
+    project_context = load_context(Path.cwd())
+    load_versions = (
+        {"regressor": options.regressor_version} if options.regressor_version else None
+    )
+    # pylint: disable=protected-access
+    catalog = project_context._get_catalog(load_versions=load_versions)
+    server = make_server(
+        catalog.load("regressor"),
+        options.socket or (options.host, options.port),
+        options.max_batch_size,
+        options.max_wait_ms / 1000,
+    )
+    logging.getLogger(__name__).info("Serving predictions on %s", server.server_address)
+    server.serve_forever()
+
+
 if __name__ == "__main__":
     # entry point for running pip-installed projects
     # using `python -m <project_package>.run` command
@@ -0,0 +1,258 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""``PrefetchRunner`` overlaps loading and saving datasets with running nodes,
+and ``FingerprintRunner`` also skips the nodes whose outputs are up to date.
+"""
+import sys
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline
+from kedro.runner import SequentialRunner, run_node
+
+from kedro_tutorial.fingerprints import (
+    FINGERPRINTS_FILEPATH,
+    NodeFingerprints,
+    _strip_transcoding,
+)
+
+DEFAULT_PREFETCH_MEMORY = 1 << 30
+DEFAULT_MAX_WORKERS = 4
+
+
+def _sizeof(data: Any) -> int:
+    """Estimates the memory held by loaded data, without going through the
+    Python objects it holds.
+    """
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return int(np.sum(data.memory_usage(index=True)))
+    return int(getattr(data, "nbytes", sys.getsizeof(data)))
+
+
+class _NodeCatalog:
+    """Stands in for the catalog while ``run_node`` runs a node: its inputs
+    are taken from their prefetched loads, and its outputs are handed over
+    to be saved in the background.  Everything else goes to the catalog.
+    """
+
+    def __init__(
+        self,
+        catalog: DataCatalog,
+        loads: Dict[str, "Future[Tuple[Any, int]]"],
+        save: Callable[[str, Any], None],
+    ):
+        self._catalog = catalog
+        self._loads = loads
+        self._save = save
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._catalog, name)
+
+    def load(self, name: str) -> Any:
+        data, _ = self._loads.pop(name).result()
+        return data
+
+    def save(self, name: str, data: Any) -> None:
+        self._save(name, data)
+
+
+class PrefetchRunner(SequentialRunner):
+    """``PrefetchRunner`` is a ``SequentialRunner`` that, when asynchronous,
+    overlaps I/O with computation: while a node runs, the inputs of the nodes
+    after it are loaded in background threads, and the outputs of the nodes
+    before it are saved in background threads.
+
+    Inputs are prefetched in the order the nodes run, for as long as the
+    prefetched data not yet used by a node fits in ``prefetch_memory``
+    bytes.  An input produced in the same run is loaded once it is saved.
+    The run ends once all outputs are saved.
+    """
+
+    def __init__(
+        self,
+        is_async: bool = False,
+        prefetch_memory: int = DEFAULT_PREFETCH_MEMORY,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """Instantiates the runner.
+
+        Args:
+            is_async: If True, the node inputs are prefetched and the node
+                outputs are saved in background threads. Defaults to False,
+                in which case the nodes run as with ``SequentialRunner``.
+            prefetch_memory: Number of bytes of prefetched data, not yet used
+                by a node, above which no further inputs are prefetched.
+                The estimate covers arrays and dataframes, not the Python
+                objects they hold.
+            max_workers: Number of threads loading, and of threads saving,
+                datasets.
+
+        """
+        super().__init__(is_async=is_async)
+        self._prefetch_memory = prefetch_memory
+        self._max_workers = max_workers
+
+    def _run(
+        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    ) -> None:
+        if not self._is_async:
+            super()._run(pipeline, catalog, run_id)
+            return
+
+        nodes = pipeline.nodes
+        load_counts = Counter(chain.from_iterable(node.inputs for node in nodes))
+        # Transcoded datasets, e.g. `table@pandas` and `table@spark`, are
+        # tracked by the name they share.
+        produced = {_strip_transcoding(name) for name in pipeline.all_outputs()}
+        done_nodes = set()
+
+        loads: List[Dict[str, "Future[Tuple[Any, int]]"]] = [{} for _ in nodes]
+        saves: Dict[str, Future] = {}
+
+        with ThreadPoolExecutor(self._max_workers) as loader, ThreadPoolExecutor(
+            self._max_workers
+        ) as saver:
+
+            def load(name: str) -> Tuple[Any, int]:
+                if _strip_transcoding(name) in saves:
+                    saves[_strip_transcoding(name)].result()
+                data = catalog.load(name)
+                return data, _sizeof(data)
+
+            def save(name: str, data: Any) -> None:
+                saves[_strip_transcoding(name)] = saver.submit(catalog.save, name, data)
+
+            def prefetch(start: int) -> None:
+                for index in range(start, len(nodes)):
+                    pending = [
+                        future for node_loads in loads for future in node_loads.values()
+                    ]
+                    loading = sum(not future.done() for future in pending)
+                    held = sum(
+                        future.result()[1]
+                        for future in pending
+                        if future.done() and not future.exception()
+                    )
+                    if index > start and (
+                        loading >= self._max_workers or held >= self._prefetch_memory
+                    ):
+                        return
+                    for name in nodes[index].inputs:
+                        if name in loads[index]:
+                            continue
+                        shared_name = _strip_transcoding(name)
+                        if shared_name in produced and shared_name not in saves:
+                            # Produced by a node which has not run yet.
+                            return
+                        loads[index][name] = loader.submit(load, name)
+
+            try:
+                for exec_index, node in enumerate(nodes):
+                    prefetch(exec_index)
+                    node_catalog = _NodeCatalog(catalog, loads[exec_index], save)
+                    run_node(node, node_catalog, False, run_id)
+                    done_nodes.add(node)
+
+                    # decrement load counts and release any data sets we've
+                    # finished with
+                    for data_set in node.inputs:
+                        load_counts[data_set] -= 1
+                        if (
+                            load_counts[data_set] < 1
+                            and data_set not in pipeline.inputs()
+                        ):
+                            catalog.release(data_set)
+                    self._logger.info(
+                        "Completed %d out of %d tasks", exec_index + 1, len(nodes)
+                    )
+                for future in saves.values():
+                    future.result()
+            except Exception:
+                for future in chain(
+                    saves.values(), *(node_loads.values() for node_loads in loads)
+                ):
+                    future.cancel()
+                self._suggest_resume_scenario(pipeline, done_nodes)
+                raise
+
+
+class FingerprintRunner(PrefetchRunner):
+    """``FingerprintRunner`` is a ``PrefetchRunner`` that skips the nodes
+    whose fingerprint matches the one recorded when they last ran
+    successfully with it, and whose outputs are saved, so that rerunning an
+    unchanged pipeline only checks the fingerprints.
+    """
+
+    def __init__(
+        self,
+        is_async: bool = False,
+        fingerprints_filepath: str = FINGERPRINTS_FILEPATH,
+        prefetch_memory: int = DEFAULT_PREFETCH_MEMORY,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """Instantiates the runner.
+
+        Args:
+            is_async: If True, the node inputs are prefetched and the node
+                outputs are saved in background threads. Defaults to False.
+            fingerprints_filepath: Path to the JSON file of the recorded node
+                fingerprints.
+            prefetch_memory: Number of bytes of prefetched data, not yet used
+                by a node, above which no further inputs are prefetched.
+            max_workers: Number of threads loading, and of threads saving,
+                datasets.
+
+        """
+        super().__init__(
+            is_async=is_async, prefetch_memory=prefetch_memory, max_workers=max_workers
+        )
+        self._fingerprints_filepath = fingerprints_filepath
+
+    def _run(
+        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    ) -> None:
+        # The nodes are fingerprinted before any of them runs and changes
+        # their inputs.
+        node_fingerprints = NodeFingerprints(self._fingerprints_filepath)
+        fingerprints = node_fingerprints.compute(pipeline, catalog)
+        up_to_date = node_fingerprints.up_to_date(pipeline, catalog, fingerprints)
+        for node in up_to_date:
+            self._logger.info("Skipping up-to-date node: %s", node.name)
+        stale_nodes = [node for node in pipeline.nodes if node not in up_to_date]
+        try:
+            super()._run(Pipeline(stale_nodes), catalog, run_id)
+        except Exception:
+            # Keep the file hashes, so that they are not computed again.
+            node_fingerprints.save()
+            raise
+        node_fingerprints.record(fingerprints, [node.name for node in stale_nodes])
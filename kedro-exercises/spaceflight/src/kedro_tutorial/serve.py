@@ -0,0 +1,261 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Long-lived scoring server for the trained regressor.
+
+The regressor is loaded once.  Concurrent requests are scored together in
+micro-batches by a single scoring thread, and the latency of the last
+requests is exposed as percentiles.
+
+``POST /predict`` takes a JSON list of shuttles, with the same features as
+the ``shuttles`` source data, and returns a JSON list of prices, ``null``
+for shuttles with missing features.  ``GET /metrics`` returns the number of
+requests and rows served, and the p50 and p99 latencies in milliseconds.
+"""
+import json
+import logging
+import queue
+import socketserver
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from kedro_tutorial.pipelines.data_science.nodes import FEATURES
+from kedro_tutorial.pipelines.inference.nodes import FLAGS, predict_price
+
+
+class _Request:
+    def __init__(self, shuttles: pd.DataFrame):
+        self.shuttles = shuttles
+        self.done = threading.Event()
+        self.prices: Optional[np.ndarray] = None
+        self.error: Optional[Exception] = None
+
+
+def _parse_shuttles(body: bytes) -> pd.DataFrame:
+    # Malformed shuttles are rejected here, before they are batched with the
+    # shuttles of other requests.
+    shuttles = pd.DataFrame(json.loads(body))
+    missing = [feature for feature in FEATURES if feature not in shuttles]
+    if missing:
+        raise KeyError(f"Missing features {missing}")
+    for feature in FEATURES:
+        if feature not in FLAGS:
+            shuttles[feature] = pd.to_numeric(shuttles[feature])
+    return shuttles[FEATURES]
+
+
+class MicroBatcher:
+    """Scores the shuttles of concurrent requests together, in batches of up
+    to ``max_batch_size`` rows collected for at most ``max_wait`` seconds.
+    """
+
+    def __init__(
+        self,
+        score: Callable[[pd.DataFrame], np.ndarray],
+        max_batch_size: int = 1024,
+        max_wait: float = 0.002,
+    ):
+        self._score = score
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._requests: queue.Queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, shuttles: pd.DataFrame) -> np.ndarray:
+        """Scores ``shuttles`` in the next batch and waits for the result."""
+        request = _Request(shuttles)
+        self._requests.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.prices
+
+    def _collect(self) -> List[_Request]:
+        batch = [self._requests.get()]
+        rows = len(batch[0].shuttles)
+        deadline = time.monotonic() + self._max_wait
+        while rows < self._max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                request = self._requests.get(timeout=timeout)
+            except queue.Empty:
+                break
+            batch.append(request)
+            rows += len(request.shuttles)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            try:
+                prices = self._score(
+                    pd.concat([request.shuttles for request in batch], sort=False)
+                )
+                offsets = np.cumsum([len(request.shuttles) for request in batch])
+                for request, part in zip(batch, np.split(prices, offsets[:-1])):
+                    request.prices = part
+            except Exception as error:  # pylint: disable=broad-except
+                if len(batch) == 1:
+                    batch[0].error = error
+                else:
+                    # Find the requests at fault, so that the others are
+                    # still scored.
+                    self._score_each(batch)
+            for request in batch:
+                request.done.set()
+
+    def _score_each(self, batch: List[_Request]) -> None:
+        for request in batch:
+            try:
+                request.prices = self._score(request.shuttles)
+            except Exception as error:  # pylint: disable=broad-except
+                request.error = error
+
+
+class LatencyStats:
+    """Percentiles of the latencies of the last ``window`` requests."""
+
+    def __init__(self, window: int = 10_000):
+        self._latencies: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.rows = 0
+
+    def record(self, latency: float, rows: int) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+            self.requests += 1
+            self.rows += rows
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            p50, p99 = np.percentile(latencies, [50, 99]) if len(latencies) else (0, 0)
+            return {
+                "requests": self.requests,
+                "rows": self.rows,
+                "latency_ms": {"p50": float(p50), "p99": float(p99)},
+            }
+
+
+class _ScoringHandler(BaseHTTPRequestHandler):
+    def _reply(self, status: int, body: Any) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        if self.path == "/metrics":
+            self._reply(200, self.server.latency.summary())
+        else:
+            self._reply(404, {"error": f"Unknown path `{self.path}`"})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        if self.path != "/predict":
+            self._reply(404, {"error": f"Unknown path `{self.path}`"})
+            return
+        start = time.perf_counter()
+        length = self.headers.get("Content-Length", "")
+        if not length.isdigit():
+            self._reply(411, {"error": "A numeric Content-Length is required"})
+            return
+        try:
+            body = self.rfile.read(int(length))
+            shuttles = _parse_shuttles(body)
+            prices = self.server.batcher.submit(shuttles)
+        except (ValueError, KeyError) as error:
+            self._reply(400, {"error": str(error)})
+            return
+        except Exception as error:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception("Failed to score shuttles")
+            self._reply(500, {"error": str(error)})
+            return
+        self._reply(
+            200, [None if np.isnan(price) else float(price) for price in prices]
+        )
+        self.server.latency.record(time.perf_counter() - start, len(shuttles))
+
+    def address_string(self) -> str:
+        # Unix socket peers have no address.
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        logging.getLogger(__name__).debug(format, *args)
+
+
+class _ScoringServerMixin(socketserver.ThreadingMixIn):
+    daemon_threads = True
+
+    def __init__(self, address, regressor, max_batch_size: int, max_wait: float):
+        super().__init__(address, _ScoringHandler)
+        self.batcher = MicroBatcher(
+            lambda shuttles: predict_price(regressor, shuttles),
+            max_batch_size,
+            max_wait,
+        )
+        self.latency = LatencyStats()
+
+
+class _TCPScoringServer(_ScoringServerMixin, HTTPServer):
+    pass
+
+
+class _UnixScoringServer(_ScoringServerMixin, socketserver.UnixStreamServer):
+    pass
+
+
+def make_server(
+    regressor,
+    address: Union[Tuple[str, int], str],
+    max_batch_size: int = 1024,
+    max_wait: float = 0.002,
+) -> socketserver.BaseServer:
+    """Creates a scoring server, to be run with ``serve_forever``.
+
+        Args:
+            regressor: Trained model.
+            address: ``(host, port)`` to listen on over TCP, or the path of a
+                Unix socket.
+            max_batch_size: Rows after which a batch is scored right away.
+            max_wait: Seconds a batch waits for more requests at most.
+        Returns:
+            The scoring server.
+
+    """
+    server_class = _UnixScoringServer if isinstance(address, str) else _TCPScoringServer
+    return server_class(address, regressor, max_batch_size, max_wait)
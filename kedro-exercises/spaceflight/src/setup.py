@@ -29,6 +29,7 @@
 from setuptools import find_packages, setup
 
 entry_point = "kedro-tutorial = kedro_tutorial.run:run_package"
+serve_entry_point = "kedro-tutorial-serve = kedro_tutorial.run:serve_package"
 
 
 # get the dependencies and installs
@@ -46,7 +47,7 @@ setup(
     name="kedro_tutorial",
     version="0.1",
     packages=find_packages(exclude=["tests"]),
-    entry_points={"console_scripts": [entry_point]},
+    entry_points={"console_scripts": [entry_point, serve_entry_point]},
     install_requires=requires,
     extras_require={
         "docs": [
@@ -0,0 +1,116 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pandas as pd
+import pytest
+from kedro.io import DataSetError
+
+from kedro_tutorial.io.chunked import (
+    ChunkedCSVLocalDataSet,
+    ChunkedExcelLocalDataSet,
+    ChunkedParquetLocalDataSet,
+    PartitionedCSVLocalDataSet,
+)
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"a": range(10), "b": list("abcdefghij")})
+
+
+class TestChunkedCSVLocalDataSet:
+    def test_save_and_load_chunks(self, tmp_path, data):
+        data_set = ChunkedCSVLocalDataSet(str(tmp_path / "test.csv"), chunksize=4)
+        data_set.save(iter([data.head(3), data.iloc[3:6], data.tail(4)]))
+
+        chunks = list(data_set.load())
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data)
+
+    def test_save_dataframe(self, tmp_path, data):
+        data_set = ChunkedCSVLocalDataSet(str(tmp_path / "test.csv"))
+        assert not data_set.exists()
+        data_set.save(data)
+        assert data_set.exists()
+        pd.testing.assert_frame_equal(next(data_set.load()), data)
+
+
+class TestChunkedExcelLocalDataSet:
+    def test_load_chunks(self, tmp_path, data):
+        filepath = str(tmp_path / "test.xlsx")
+        data.to_excel(filepath, index=False)
+        data_set = ChunkedExcelLocalDataSet(filepath, chunksize=4)
+
+        chunks = list(data_set.load())
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data)
+
+    def test_save_is_not_supported(self, tmp_path, data):
+        data_set = ChunkedExcelLocalDataSet(str(tmp_path / "test.xlsx"))
+        with pytest.raises(DataSetError, match="read-only"):
+            data_set.save([data])
+
+
+class TestChunkedParquetLocalDataSet:
+    def test_save_and_load_row_groups(self, tmp_path, data):
+        data_set = ChunkedParquetLocalDataSet(str(tmp_path / "test.parquet"))
+        data_set.save(iter([data.head(3), data.iloc[3:6], data.tail(4)]))
+
+        chunks = list(data_set.load())
+        assert [len(chunk) for chunk in chunks] == [3, 3, 4]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data)
+
+    def test_load_columns(self, tmp_path, data):
+        filepath = str(tmp_path / "test.parquet")
+        ChunkedParquetLocalDataSet(filepath).save(data)
+        data_set = ChunkedParquetLocalDataSet(filepath, load_args={"columns": ["b"]})
+        pd.testing.assert_frame_equal(next(data_set.load()), data[["b"]])
+
+    def test_later_chunks_follow_first_schema(self, tmp_path):
+        data_set = ChunkedParquetLocalDataSet(str(tmp_path / "test.parquet"))
+        data_set.save(iter([pd.DataFrame({"a": [0.5]}), pd.DataFrame({"a": [1]})]))
+        assert pd.concat(data_set.load())["a"].dtype == float
+
+
+class TestPartitionedCSVLocalDataSet:
+    def test_save_and_load_partitions(self, tmp_path, data):
+        data_set = PartitionedCSVLocalDataSet(str(tmp_path / "test"))
+        assert not data_set.exists()
+        data_set.save((str(i), data[data.a % 2 == i]) for i in range(2))
+        assert data_set.exists()
+
+        partitions = data_set.load()
+        assert sorted(partitions) == ["0", "1"]
+        pd.testing.assert_frame_equal(
+            partitions["1"](), data[data.a % 2 == 1].reset_index(drop=True)
+        )
+
+    def test_save_removes_stale_partitions(self, tmp_path, data):
+        data_set = PartitionedCSVLocalDataSet(str(tmp_path / "test"))
+        data_set.save({"old": data})
+        data_set.save({"new": lambda: data})
+        assert list(data_set.load()) == ["new"]
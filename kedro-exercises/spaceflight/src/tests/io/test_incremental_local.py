@@ -0,0 +1,130 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pandas as pd
+import pytest
+
+from kedro_tutorial.io.incremental import (
+    IncrementalCSVLocalDataSet,
+    ParquetPartsLocalDataSet,
+)
+
+
+@pytest.fixture
+def filepath(tmp_path):
+    filepath = tmp_path / "test.csv"
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}).to_csv(filepath, index=False)
+    return str(filepath)
+
+
+@pytest.fixture
+def watermark_filepath(tmp_path):
+    return str(tmp_path / "parts" / "_watermark.json")
+
+
+def append_rows(filepath, data):
+    data.to_csv(filepath, mode="a", header=False, index=False)
+
+
+class TestIncrementalCSVLocalDataSet:
+    def test_loads_rows_appended_since_confirm(self, filepath, watermark_filepath):
+        data_set = IncrementalCSVLocalDataSet(filepath, watermark_filepath)
+        assert data_set.load()["a"].tolist() == [1, 2]
+        data_set.confirm()
+
+        append_rows(filepath, pd.DataFrame({"a": [3], "b": ["z"]}))
+        new_rows = data_set.load()
+        assert new_rows["a"].tolist() == [3]
+        assert new_rows.index.tolist() == [2]
+
+    def test_reloads_rows_until_confirmed(self, filepath, watermark_filepath):
+        data_set = IncrementalCSVLocalDataSet(filepath, watermark_filepath)
+        data_set.load()
+
+        assert data_set.load()["a"].tolist() == [1, 2]
+
+    def test_full_load_moves_watermark(self, filepath, watermark_filepath):
+        full = IncrementalCSVLocalDataSet(
+            filepath, watermark_filepath, incremental=False
+        )
+        full.load()
+        full.confirm()
+
+        incremental = IncrementalCSVLocalDataSet(filepath, watermark_filepath)
+        assert incremental.load().empty
+        assert full.load()["a"].tolist() == [1, 2]
+
+    def test_full_load_keeps_last_line_without_line_break(
+        self, tmp_path, watermark_filepath
+    ):
+        filepath = tmp_path / "test.csv"
+        filepath.write_text("shuttle_id,score\n1,10\n2,20")
+        full = IncrementalCSVLocalDataSet(
+            str(filepath), watermark_filepath, incremental=False
+        )
+
+        assert full.load()["score"].tolist() == [10, 20]
+
+    def test_ignores_incomplete_last_line(self, filepath, watermark_filepath):
+        data_set = IncrementalCSVLocalDataSet(filepath, watermark_filepath)
+        data_set.load()
+        data_set.confirm()
+        with open(filepath, "a") as file:
+            file.write("3,z\n4,")
+
+        assert data_set.load()["a"].tolist() == [3]
+        data_set.confirm()
+        with open(filepath, "a") as file:
+            file.write("w\n")
+        assert data_set.load()["b"].tolist() == ["w"]
+
+
+class TestParquetPartsLocalDataSet:
+    def test_appends_parts(self, tmp_path):
+        path = str(tmp_path / "parts")
+        data = pd.DataFrame({"a": range(10), "b": [float(i) for i in range(10)]})
+        ParquetPartsLocalDataSet(path).save(data[:6])
+        ParquetPartsLocalDataSet(path, append=True).save(data[6:])
+
+        reloaded = ParquetPartsLocalDataSet(path).load()
+        pd.testing.assert_frame_equal(reloaded, data)
+
+    def test_overwrites_parts(self, tmp_path, watermark_filepath):
+        path = str(tmp_path / "parts")
+        ParquetPartsLocalDataSet(path).save(pd.DataFrame({"a": [1, 2]}))
+        with open(watermark_filepath, "w") as file:
+            file.write("{}")
+        ParquetPartsLocalDataSet(path).save(pd.DataFrame({"a": [3]}))
+
+        assert ParquetPartsLocalDataSet(path).load()["a"].tolist() == [3]
+
+    def test_appends_in_existing_schema(self, tmp_path):
+        path = str(tmp_path / "parts")
+        ParquetPartsLocalDataSet(path).save(pd.DataFrame({"a": [1.5]}))
+        ParquetPartsLocalDataSet(path, append=True).save(pd.DataFrame({"a": [2]}))
+
+        assert ParquetPartsLocalDataSet(path).load()["a"].tolist() == [1.5, 2.0]
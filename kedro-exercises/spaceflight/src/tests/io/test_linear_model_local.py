@@ -0,0 +1,133 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import shutil
+
+import numpy as np
+import pytest
+from kedro.io import Version
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.tree import DecisionTreeRegressor
+
+from kedro_tutorial.io.model import LinearModelLocalDataSet
+from kedro_tutorial.io.versioning import INDEX_FILENAME
+
+
+@pytest.fixture
+def data():
+    rng = np.random.RandomState(0)
+    X = rng.normal(size=(50, 3))
+    return X, X @ [1.0, 2.0, 3.0] + 4
+
+
+@pytest.fixture
+def filepath(tmp_path):
+    return str(tmp_path / "regressor.lm")
+
+
+class TestLinearModelLocalDataSet:
+    @pytest.mark.parametrize("model", [LinearRegression(), Ridge(alpha=0.5)])
+    def test_round_trip_memory_maps_arrays(self, data, filepath, model):
+        X, y = data
+        model.fit(X, y)
+        data_set = LinearModelLocalDataSet(filepath)
+        data_set.save(model)
+        reloaded = data_set.load()
+
+        assert type(reloaded) is type(model)
+        assert reloaded.get_params() == model.get_params()
+        assert not reloaded.coef_.flags.owndata
+        assert not reloaded.coef_.flags.writeable
+        np.testing.assert_array_equal(reloaded.predict(X), model.predict(X))
+
+    def test_falls_back_to_pickle(self, data, filepath):
+        X, y = data
+        model = DecisionTreeRegressor(random_state=0).fit(X, y)
+        data_set = LinearModelLocalDataSet(filepath)
+        data_set.save(model)
+
+        np.testing.assert_array_equal(data_set.load().predict(X), model.predict(X))
+
+    def test_versioned(self, data, filepath):
+        X, y = data
+        data_set = LinearModelLocalDataSet(filepath, version=Version(None, None))
+        assert not data_set.exists()
+
+        data_set.save(LinearRegression().fit(X, y))
+        assert data_set.exists()
+        np.testing.assert_allclose(data_set.load().predict(X), y)
+
+    def test_resolves_latest_version_from_index(self, data, filepath, mocker):
+        X, y = data
+        for save_version in ("2020-01-01T00.00.00.000Z", "2020-01-02T00.00.00.000Z"):
+            LinearModelLocalDataSet(filepath, version=Version(None, save_version)).save(
+                LinearRegression().fit(X, y + len(save_version))
+            )
+        scandir = mocker.patch("os.scandir")
+
+        data_set = LinearModelLocalDataSet(filepath, version=Version(None, None))
+        assert data_set.resolve_load_version() == "2020-01-02T00.00.00.000Z"
+        scandir.assert_not_called()
+
+    def test_rebuilds_index_missing_a_version(self, data, filepath, tmp_path):
+        X, y = data
+        LinearModelLocalDataSet(
+            filepath, version=Version(None, "2020-01-01T00.00.00.000Z")
+        ).save(LinearRegression().fit(X, y))
+        # Another writer adds a newer version without updating the index.
+        shutil.copytree(
+            tmp_path / "regressor.lm" / "2020-01-01T00.00.00.000Z",
+            tmp_path / "regressor.lm" / "2020-01-02T00.00.00.000Z",
+        )
+
+        data_set = LinearModelLocalDataSet(filepath, version=Version(None, None))
+        assert data_set.resolve_load_version() == "2020-01-02T00.00.00.000Z"
+
+    def test_prunes_old_versions(self, data, filepath, tmp_path):
+        X, y = data
+        save_versions = [f"2020-01-0{day}T00.00.00.000Z" for day in range(1, 5)]
+        for save_version in save_versions:
+            LinearModelLocalDataSet(
+                filepath, version=Version(None, save_version), keep_versions=2
+            ).save(LinearRegression().fit(X, y))
+
+        remaining = sorted(
+            path.name for path in (tmp_path / "regressor.lm").iterdir() if path.is_dir()
+        )
+        assert remaining == save_versions[2:]
+
+    def test_rebuilds_missing_index(self, data, filepath, tmp_path):
+        X, y = data
+        for save_version in ("2020-01-01T00.00.00.000Z", "2020-01-02T00.00.00.000Z"):
+            LinearModelLocalDataSet(filepath, version=Version(None, save_version)).save(
+                LinearRegression().fit(X, y)
+            )
+        (tmp_path / "regressor.lm" / INDEX_FILENAME).unlink()
+
+        data_set = LinearModelLocalDataSet(filepath, version=Version(None, None))
+        assert data_set.resolve_load_version() == "2020-01-02T00.00.00.000Z"
+        assert (tmp_path / "regressor.lm" / INDEX_FILENAME).is_file()
@@ -0,0 +1,54 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+from kedro_tutorial.io.array import NpyLocalDataSet
+
+
+class TestNpyLocalDataSet:
+    def test_loads_memory_map(self, tmp_path):
+        data = np.arange(12.0).reshape(4, 3)
+        data_set = NpyLocalDataSet(str(tmp_path / "data" / "X.npy"))
+        assert not data_set.exists()
+        data_set.save(data[1:])
+
+        reloaded = data_set.load()
+        assert isinstance(reloaded, np.memmap)
+        assert not reloaded.flags.writeable
+        np.testing.assert_array_equal(reloaded, data[1:])
+
+    def test_loads_into_memory(self, tmp_path):
+        data = np.arange(4)
+        data_set = NpyLocalDataSet(
+            str(tmp_path / "y.npy"), load_args={"mmap_mode": None}
+        )
+        data_set.save(data)
+
+        reloaded = data_set.load()
+        assert not isinstance(reloaded, np.memmap)
+        np.testing.assert_array_equal(reloaded, data)
@@ -0,0 +1,328 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import os
+
+import pandas as pd
+import pytest
+from kedro.io import DataSetError
+from PIL import Image
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.util import Inches, Pt
+
+from kedro_tutorial.io.powerpoint import (
+    PowerPointLocalDataSet,
+    PowerPointPartitionedLocalDataSet,
+    powerpoint_local,
+)
+
+
+def _style(cell, text, rgb):
+    cell.fill.solid()
+    cell.fill.fore_color.rgb = RGBColor.from_string(rgb)
+    run = cell.text_frame.paragraphs[0].add_run()
+    run.text = text
+    run.font.size = Pt(10)
+    run.font.color.theme_color = MSO_THEME_COLOR.TEXT_1
+
+
+@pytest.fixture
+def template_filepath(tmp_path, monkeypatch):
+    """A template like the McK Digital one, with the example table on slide
+    ``TEMPLATE_SLIDE_INDEX``.
+    """
+    prs = Presentation()
+    title_only = prs.slide_layouts[5]
+    for index in range(powerpoint_local.TEMPLATE_SLIDE_INDEX + 2):
+        slide = prs.slides.add_slide(title_only)
+        slide.shapes.title.text = f"Slide {index}"
+    slide = prs.slides[powerpoint_local.TEMPLATE_SLIDE_INDEX]
+    slide.shapes.title.text = "Table"
+    table = slide.shapes.add_table(
+        3, 2, Inches(1), Inches(2), Inches(6), Inches(1.5)
+    ).table
+    for row, rgb in zip(table.rows, ("000000", "EEEEEE", "FFFFFF")):
+        for cell in row.cells:
+            _style(cell, "x", rgb)
+    logo = io.BytesIO()
+    Image.new("RGB", (4, 4), "red").save(logo, format="PNG")
+    slide.shapes.add_picture(logo, Inches(8), Inches(0.5))
+
+    template_filepath = str(tmp_path / "template.pptx")
+    prs.save(template_filepath)
+    monkeypatch.setattr(powerpoint_local, "TEMPLATE_FILEPATH", template_filepath)
+    monkeypatch.setattr(
+        powerpoint_local, "PRUNED_TEMPLATE_DIR", str(tmp_path / "cache")
+    )
+    return template_filepath
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+
+class TestPowerPointLocalDataSet:
+    def test_save_and_load(self, template_filepath, tmp_path, data):
+        data_set = PowerPointLocalDataSet(
+            str(tmp_path / "test.pptx"), save_args={"title": "Metrics"}
+        )
+        data_set.save(data)
+
+        prs = Presentation(str(tmp_path / "test.pptx"))
+        [slide] = prs.slides
+        assert slide.shapes.title.text == "Metrics"
+        pd.testing.assert_frame_equal(data_set.load(), data)
+
+    def test_prunes_template_once(self, template_filepath, tmp_path, data, mocker):
+        prune = mocker.spy(powerpoint_local, "_prune_template")
+        for index in range(2):
+            PowerPointLocalDataSet(str(tmp_path / f"test{index}.pptx")).save(data)
+
+        assert prune.call_count == 1
+        [pruned_filename] = os.listdir(str(tmp_path / "cache"))
+        assert pruned_filename.startswith("template.")
+        assert pruned_filename.endswith(
+            f".slide-{powerpoint_local.TEMPLATE_SLIDE_INDEX}.pptx"
+        )
+
+    def test_reuses_pruned_template_on_disk(
+        self, template_filepath, tmp_path, data, mocker
+    ):
+        PowerPointLocalDataSet(str(tmp_path / "first.pptx")).save(data)
+        powerpoint_local._pruned_template.cache_clear()
+        prune = mocker.spy(powerpoint_local, "_prune_template")
+
+        data_set = PowerPointLocalDataSet(str(tmp_path / "second.pptx"))
+        data_set.save(data)
+
+        prune.assert_not_called()
+        pd.testing.assert_frame_equal(data_set.load(), data)
+
+    def test_copies_band_styles(self, template_filepath, tmp_path):
+        data = pd.DataFrame({"a": range(5), "b": range(5, 10)})
+        data_set = PowerPointLocalDataSet(str(tmp_path / "test.pptx"))
+        data_set.save(data)
+
+        [slide] = Presentation(str(tmp_path / "test.pptx")).slides
+        table = PowerPointLocalDataSet._get_table(slide)
+        fills = [str(row.cells[1].fill.fore_color.rgb) for row in table.rows]
+        assert fills == ["000000"] + ["EEEEEE", "FFFFFF"] * 2 + ["EEEEEE"]
+        pd.testing.assert_frame_equal(data_set.load(), data)
+
+    def test_infers_column_types(self, template_filepath, tmp_path):
+        data = pd.DataFrame(
+            {
+                "ints": [1, 2, 3],
+                "floats": [1.5, None, 2.0],
+                "bools": [True, False, True],
+                "text": ["x", "y", None],
+            }
+        )
+        data_set = PowerPointLocalDataSet(str(tmp_path / "test.pptx"))
+        data_set.save(data)
+
+        reloaded = data_set.load()
+        assert list(reloaded.dtypes[:3]) == ["int64", "float64", "bool"]
+        pd.testing.assert_frame_equal(reloaded, data, check_dtype=False)
+
+    def test_infers_booleans_with_missing_values(self, template_filepath, tmp_path):
+        data = pd.DataFrame({"a": [True, None, False], "b": [1, 2, 3]})
+        data_set = PowerPointLocalDataSet(str(tmp_path / "test.pptx"))
+        data_set.save(data)
+
+        reloaded = data_set.load()
+        assert reloaded["a"].tolist()[::2] == [True, False]
+        assert pd.isna(reloaded["a"][1])
+        assert [type(value) for value in reloaded["a"][::2]] == [bool, bool]
+
+    def test_renames_duplicate_columns(self, template_filepath, tmp_path):
+        data = pd.DataFrame([[1, 2, 3, 4]], columns=["a", "a", "a.1", "a"])
+        filepath = str(tmp_path / "test.pptx")
+        PowerPointLocalDataSet(filepath).save(data)
+
+        reloaded = PowerPointLocalDataSet(filepath).load()
+        expected = pd.read_csv(io.StringIO(data.to_csv()), index_col=0)
+        assert list(reloaded.columns) == ["a", "a.2", "a.1", "a.3"]
+        pd.testing.assert_frame_equal(reloaded, expected)
+
+    def test_loads_text_with_commas_and_newlines(
+        self, template_filepath, tmp_path, data
+    ):
+        filepath = str(tmp_path / "test.pptx")
+        PowerPointLocalDataSet(filepath).save(data)
+        prs = Presentation(filepath)
+        [slide] = prs.slides
+        PowerPointLocalDataSet._get_table(slide).cell(1, 1).text = "1, 2\n3"
+        prs.save(filepath)
+
+        reloaded = PowerPointLocalDataSet(filepath).load()
+        assert list(reloaded["a"]) == ["1, 2\n3", "2", "3"]
+
+    def test_saves_text_with_commas(self, template_filepath, tmp_path):
+        data = pd.DataFrame({"a": ["x,y", "z"], "b": [1, 2]})
+        data_set = PowerPointLocalDataSet(str(tmp_path / "test.pptx"))
+        data_set.save(data)
+
+        pd.testing.assert_frame_equal(data_set.load(), data)
+
+    def test_saves_text_with_newlines(self, template_filepath, tmp_path):
+        data = pd.DataFrame({"a": ["x\ny", "z", "w"], "b": [1, 2, 3]})
+        filepath = str(tmp_path / "test.pptx")
+        data_set = PowerPointLocalDataSet(filepath, save_args={"rows_per_slide": 2})
+        data_set.save(data)
+
+        slides = Presentation(filepath).slides
+        assert [
+            len(PowerPointLocalDataSet._get_table(slide).rows) for slide in slides
+        ] == [3, 2]
+        pd.testing.assert_frame_equal(data_set.load(), data)
+
+    def test_paginates_large_tables(self, template_filepath, tmp_path):
+        data = pd.DataFrame({"a": range(7), "b": range(7, 14)})
+        filepath = str(tmp_path / "test.pptx")
+        data_set = PowerPointLocalDataSet(
+            filepath, save_args={"title": "Metrics", "rows_per_slide": 3}
+        )
+        data_set.save(data)
+
+        slides = Presentation(filepath).slides
+        assert [slide.shapes.title.text for slide in slides] == ["Metrics"] * 3
+        assert [
+            [
+                cell.text
+                for cell in PowerPointLocalDataSet._get_table(slide).rows[0].cells
+            ]
+            for slide in slides
+        ] == [["", "a", "b"]] * 3
+        assert [
+            len(PowerPointLocalDataSet._get_table(slide).rows) for slide in slides
+        ] == [4, 4, 2]
+        pd.testing.assert_frame_equal(data_set.load(), data)
+
+    @pytest.mark.parametrize("rows_per_slide", [-1, 0, 2.5, True])
+    def test_rejects_invalid_rows_per_slide(self, tmp_path, rows_per_slide):
+        with pytest.raises(DataSetError, match="positive integer"):
+            PowerPointLocalDataSet(
+                str(tmp_path / "test.pptx"),
+                save_args={"rows_per_slide": rows_per_slide},
+            )
+
+
+class TestPowerPointPartitionedLocalDataSet:
+    @pytest.fixture
+    def partitions(self):
+        return {
+            name: pd.DataFrame({"a": range(size), "b": range(size, 2 * size)})
+            for name, size in (("train", 3), ("test", 2), ("validation", 4))
+        }
+
+    def test_save_and_load(self, template_filepath, tmp_path, partitions):
+        filepath = str(tmp_path / "test.pptx")
+        data_set = PowerPointPartitionedLocalDataSet(filepath)
+        data_set.save(partitions)
+
+        prs = Presentation(filepath)
+        assert [slide.shapes.title.text for slide in prs.slides] == list(partitions)
+        for slide in prs.slides:
+            [picture] = [
+                shape
+                for shape in slide.shapes
+                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE
+            ]
+            assert picture.image.blob
+        reloaded = data_set.load()
+        assert list(reloaded) == list(partitions)
+        for name, data in partitions.items():
+            pd.testing.assert_frame_equal(reloaded[name](), data)
+
+    def test_loads_selected_partitions(self, template_filepath, tmp_path, partitions):
+        filepath = str(tmp_path / "test.pptx")
+        PowerPointPartitionedLocalDataSet(filepath).save(partitions)
+
+        reloaded = PowerPointPartitionedLocalDataSet(
+            filepath, load_args={"partitions": ["test"]}
+        ).load()
+
+        assert list(reloaded) == ["test"]
+        pd.testing.assert_frame_equal(reloaded["test"](), partitions["test"])
+
+    def test_paginates_partitions(self, template_filepath, tmp_path, partitions):
+        filepath = str(tmp_path / "test.pptx")
+        data_set = PowerPointPartitionedLocalDataSet(
+            filepath, save_args={"rows_per_slide": 2}
+        )
+        data_set.save(partitions)
+
+        prs = Presentation(filepath)
+        assert [slide.shapes.title.text for slide in prs.slides] == [
+            "train",
+            "train",
+            "test",
+            "validation",
+            "validation",
+        ]
+        reloaded = data_set.load()
+        assert list(reloaded) == list(partitions)
+        for name, data in partitions.items():
+            pd.testing.assert_frame_equal(reloaded[name](), data)
+
+    def test_missing_partitions(self, template_filepath, tmp_path, partitions):
+        filepath = str(tmp_path / "test.pptx")
+        PowerPointPartitionedLocalDataSet(filepath).save(partitions)
+
+        data_set = PowerPointPartitionedLocalDataSet(
+            filepath, load_args={"partitions": ["holdout"]}
+        )
+        with pytest.raises(DataSetError, match="holdout"):
+            data_set.load()
+
+    def test_rejects_partition_names_other_than_strings(
+        self, template_filepath, tmp_path, partitions
+    ):
+        data_set = PowerPointPartitionedLocalDataSet(str(tmp_path / "test.pptx"))
+        with pytest.raises(DataSetError, match=r"strings, got \[1\]"):
+            data_set.save({**partitions, 1: partitions["train"]})
+
+    @pytest.mark.parametrize("name", ["~", "~~", "~continued", "continued"])
+    def test_partitions_named_like_continued_slides(
+        self, template_filepath, tmp_path, partitions, name
+    ):
+        partitions = {"train": partitions["train"], name: partitions["validation"]}
+        data_set = PowerPointPartitionedLocalDataSet(
+            str(tmp_path / "test.pptx"), save_args={"rows_per_slide": 2}
+        )
+        data_set.save(partitions)
+
+        reloaded = data_set.load()
+        assert list(reloaded) == list(partitions)
+        for partition, data in partitions.items():
+            pd.testing.assert_frame_equal(reloaded[partition](), data)
@@ -0,0 +1,77 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import pandas as pd
+import pytest
+from kedro.extras.datasets.pandas import CSVDataSet
+
+from kedro_tutorial.io.sidecar import SidecarCachedDataSet
+
+
+@pytest.fixture
+def filepath(tmp_path):
+    filepath = tmp_path / "test.csv"
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}).to_csv(filepath, index=False)
+    return str(filepath)
+
+
+@pytest.fixture
+def data_set(filepath):
+    return SidecarCachedDataSet(
+        dataset={"type": "pandas.CSVDataSet", "filepath": filepath}
+    )
+
+
+class TestSidecarCachedDataSet:
+    def test_loads_from_sidecar(self, mocker, filepath, data_set):
+        source_load = mocker.spy(CSVDataSet, "_load")
+        first = data_set.load()
+        second = data_set.load()
+
+        assert source_load.call_count == 1
+        assert os.path.isfile(f"{filepath}.parquet")
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_rebuilds_when_source_changes(self, mocker, filepath, data_set):
+        data_set.load()
+        pd.DataFrame({"a": [3], "b": ["z"]}).to_csv(filepath, index=False)
+        source_load = mocker.spy(CSVDataSet, "_load")
+
+        assert data_set.load()["a"].tolist() == [3]
+        assert source_load.call_count == 1
+
+    def test_keeps_sidecar_when_source_is_touched(self, mocker, filepath, data_set):
+        data_set.load()
+        stat = os.stat(filepath)
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        source_load = mocker.spy(CSVDataSet, "_load")
+
+        data_set.load()
+        data_set.load()
+        assert source_load.call_count == 0
@@ -0,0 +1,61 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+from kedro_tutorial.pipelines.data_engineering.compaction import compact
+
+
+class TestCompact:
+    def test_compact_dtypes(self):
+        data = pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4],
+                "engines": [1.0, 2.0, np.nan, 1.0],
+                "type": ["a", "b", "a", "a"],
+                "flag": [True, False, True, True],
+            }
+        )
+        compacted = compact(data)
+
+        assert compacted.dtypes.to_dict() == {
+            "id": np.dtype("int8"),
+            "engines": np.dtype("float32"),
+            "type": "category",
+            "flag": np.dtype("bool"),
+        }
+        pd.testing.assert_frame_equal(compacted.astype(data.dtypes), data)
+
+    def test_keeps_lossy_columns(self):
+        data = pd.DataFrame({"price": [0.1, 1e300], "name": ["a", "b"]})
+        compacted = compact(data, max_category_ratio=0.5)
+        assert compacted.dtypes.equals(data.dtypes)
+
+    def test_float_downcast_can_be_disabled(self):
+        data = pd.DataFrame({"engines": [1.0, 2.0]})
+        assert compact(data, downcast_floats=False)["engines"].dtype == np.float64
@@ -0,0 +1,77 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+import pytest
+
+from kedro_tutorial.pipelines.data_engineering.joins import (
+    hash_join_master_table,
+    merge_master_table,
+)
+
+
+@pytest.fixture
+def shuttles():
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "engines": [1.0, 2.0, np.nan, 1.0],
+            "company_id": [10, 20, 10, 30],
+        }
+    )
+
+
+@pytest.fixture
+def companies():
+    # Company ids are not unique in the raw data.
+    return pd.DataFrame(
+        {"id": [10, 20, 20, 40], "company_rating": [0.9, 0.5, 0.7, np.nan]}
+    )
+
+
+@pytest.fixture
+def reviews():
+    return pd.DataFrame(
+        {"shuttle_id": [2, 1, 3, 2, 5], "review_scores_rating": [90, 80, 70, 60, 50]}
+    )
+
+
+def _sorted(data: pd.DataFrame) -> pd.DataFrame:
+    return data.sort_values(list(data.columns)).reset_index(drop=True)
+
+
+class TestHashJoinMasterTable:
+    def test_matches_merge(self, shuttles, companies, reviews):
+        expected = merge_master_table(shuttles, companies, reviews)
+        actual = hash_join_master_table(shuttles, companies, reviews)
+        pd.testing.assert_frame_equal(_sorted(actual), _sorted(expected))
+
+    def test_rows_follow_reviews(self, shuttles, companies, reviews):
+        actual = hash_join_master_table(shuttles, companies, reviews)
+        assert actual["id_x"].tolist() == [2, 2, 1, 2, 2]
+        assert actual["company_rating"].tolist() == [0.5, 0.7, 0.9, 0.5, 0.7]
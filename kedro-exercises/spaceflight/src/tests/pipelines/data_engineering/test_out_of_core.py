@@ -0,0 +1,70 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+from kedro_tutorial.pipelines.data_engineering.joins import merge_master_table
+from kedro_tutorial.pipelines.data_engineering.out_of_core import (
+    create_master_table_partitions,
+)
+
+
+def _chunks(data: pd.DataFrame, size: int):
+    return (chunk for _, chunk in data.groupby(np.arange(len(data)) // size))
+
+
+def test_partitions_match_merge(tmp_path):
+    shuttles = pd.DataFrame(
+        {
+            "id": np.arange(100),
+            "engines": np.where(np.arange(100) % 7 == 0, np.nan, 1.0),
+            "company_id": np.arange(100) % 13,
+        }
+    )
+    companies = pd.DataFrame(
+        {"id": np.arange(20) % 15, "company_rating": np.linspace(0, 1, 20)}
+    )
+    reviews = pd.DataFrame(
+        {"shuttle_id": np.arange(300) % 110, "review_scores_rating": np.arange(300)}
+    )
+
+    partitions = create_master_table_partitions(
+        _chunks(shuttles, 30),
+        _chunks(companies, 6),
+        _chunks(reviews, 50),
+        {"num_partitions": 4, "spill_dir": str(tmp_path)},
+    )
+    actual = pd.concat(data for _, data in partitions)
+    expected = merge_master_table(shuttles, companies, reviews)
+
+    columns = list(expected.columns)
+    pd.testing.assert_frame_equal(
+        actual.sort_values(columns).reset_index(drop=True),
+        expected.sort_values(columns).reset_index(drop=True),
+    )
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,73 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+import pytest
+
+from kedro_tutorial.pipelines.data_engineering.parsing import (
+    is_true,
+    parse_money,
+    parse_percentage,
+)
+
+
+def _parse_percentage_scalar(x):
+    if isinstance(x, str):
+        return float(x.replace("%", "")) / 100
+    return float("NaN")
+
+
+class TestIsTrue:
+    def test_flags(self):
+        series = pd.Series(["t", "f", np.nan, "t"])
+        assert is_true(series).tolist() == [True, False, False, True]
+
+    def test_typed_booleans(self):
+        series = pd.Series([True, False, None], dtype="boolean")
+        assert is_true(series).tolist() == [True, False, False]
+
+
+class TestParsePercentage:
+    def test_matches_scalar_parser(self):
+        series = pd.Series(["100%", "67%", np.nan, "0%", "12.5%"])
+        expected = series.apply(_parse_percentage_scalar)
+        pd.testing.assert_series_equal(parse_percentage(series), expected)
+
+    def test_all_missing(self):
+        series = pd.Series([np.nan, np.nan])
+        assert parse_percentage(series).isna().all()
+
+    def test_invalid_value(self):
+        with pytest.raises(ValueError):
+            parse_percentage(pd.Series(["abc%"]))
+
+
+class TestParseMoney:
+    def test_parses_amounts(self):
+        series = pd.Series(["$1,325.0", "$4,000.5", "$12.0"])
+        assert parse_money(series).tolist() == [1325.0, 4000.5, 12.0]
@@ -0,0 +1,86 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import KFold, cross_val_score
+
+from kedro_tutorial.pipelines.data_science.cross_validation import (
+    cross_validate_model,
+    split_folds,
+)
+
+METRICS = ["sklearn.metrics.r2_score", "sklearn.metrics.mean_squared_error"]
+
+
+@pytest.fixture
+def master_table():
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame(
+        {
+            "engines": rng.randint(1, 4, 200).astype(float),
+            "passenger_capacity": rng.randint(1, 10, 200),
+            "crew": rng.uniform(size=200),
+            "d_check_complete": rng.uniform(size=200) < 0.5,
+            "moon_clearance_complete": rng.uniform(size=200) < 0.5,
+        }
+    )
+    data["price"] = data["engines"] * 3 + data["crew"] * 100 + rng.uniform(size=200)
+    return data
+
+
+@pytest.fixture
+def cross_validation():
+    return {"n_splits": 4, "shuffle": True, "random_state": 3, "n_jobs": 2}
+
+
+class TestCrossValidateModel:
+    def test_matches_cross_val_score(self, master_table, cross_validation):
+        X, y, folds = split_folds(master_table, cross_validation)
+        results = cross_validate_model(
+            X, y, folds, cross_validation, {"mode": "in_memory"}, METRICS
+        )
+
+        expected = cross_val_score(
+            LinearRegression(),
+            X,
+            y,
+            cv=KFold(n_splits=4, shuffle=True, random_state=3),
+            scoring="r2",
+        )
+        assert list(results.columns) == [
+            "Train mean",
+            "Train std",
+            "Test mean",
+            "Test std",
+        ]
+        assert results.loc["r2_score", "Test mean"] == pytest.approx(expected.mean())
+        assert results.loc["r2_score", "Test std"] == pytest.approx(
+            expected.std(ddof=1)
+        )
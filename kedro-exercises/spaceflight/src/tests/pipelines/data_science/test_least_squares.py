@@ -0,0 +1,90 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from kedro_tutorial.io.array import NpyLocalDataSet
+from kedro_tutorial.pipelines.data_science import least_squares
+from kedro_tutorial.pipelines.data_science.least_squares import (
+    SufficientStatistics,
+    fit_least_squares,
+)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.RandomState(0)
+    X = rng.normal(size=(1000, 4)) + [0.0, 10.0, 100.0, 1000.0]
+    y = X @ [1.0, -2.0, 3.0, 0.5] + rng.normal(size=1000) + 1000
+    return X, y
+
+
+class TestFitLeastSquares:
+    @pytest.mark.parametrize("n_jobs", [1, 2, -1])
+    def test_matches_linear_regression(self, data, n_jobs):
+        X, y = data
+        expected = LinearRegression().fit(X, y)
+
+        regressor = fit_least_squares(X, y, 64, n_jobs)
+        np.testing.assert_allclose(regressor.coef_, expected.coef_)
+        np.testing.assert_allclose(regressor.intercept_, expected.intercept_)
+        np.testing.assert_allclose(regressor.predict(X), expected.predict(X))
+
+    def test_maps_chunks_of_memory_mapped_arrays(self, data, tmp_path):
+        X, y = data
+        for name, array in (("X", X), ("y", y)):
+            NpyLocalDataSet(str(tmp_path / f"{name}.npy")).save(array)
+        X_mapped = NpyLocalDataSet(str(tmp_path / "X.npy")).load()
+        y_mapped = NpyLocalDataSet(str(tmp_path / "y.npy")).load()
+
+        rows = least_squares._rows(X_mapped, 960, 1024)
+        assert isinstance(rows, least_squares._MappedRows)
+        np.testing.assert_array_equal(rows.load(), X[960:])
+
+        expected = LinearRegression().fit(X, y)
+        regressor = fit_least_squares(X_mapped, y_mapped, 64, n_jobs=2)
+        np.testing.assert_allclose(regressor.coef_, expected.coef_)
+        np.testing.assert_allclose(regressor.intercept_, expected.intercept_)
+
+    def test_rejects_zero_jobs(self, data):
+        X, y = data
+        with pytest.raises(ValueError, match="not 0"):
+            fit_least_squares(X, y, 64, 0)
+
+    def test_merge_is_order_independent(self, data):
+        X, y = data
+        left = SufficientStatistics.of(X[:300], y[:300])
+        right = SufficientStatistics.of(X[300:], y[300:])
+
+        merged = SufficientStatistics.of(X[300:], y[300:]).merge(left)
+        whole = SufficientStatistics.of(X, y)
+        for statistics in (left.merge(right), merged):
+            assert statistics.count == whole.count
+            np.testing.assert_allclose(statistics.mean, whole.mean)
+            np.testing.assert_allclose(statistics.cross, whole.cross)
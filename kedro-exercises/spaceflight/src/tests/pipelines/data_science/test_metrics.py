@@ -0,0 +1,91 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import (
+    explained_variance_score,
+    max_error,
+    mean_absolute_error,
+    mean_squared_error,
+    r2_score,
+)
+
+from kedro_tutorial.pipelines.data_science.metrics import MetricRegistry, row_chunks
+
+METRICS = [
+    "sklearn.metrics.r2_score",
+    "sklearn.metrics.explained_variance_score",
+    "sklearn.metrics.mean_squared_error",
+    "sklearn.metrics.mean_absolute_error",
+    "sklearn.metrics.max_error",
+]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.RandomState(0)
+    X = rng.normal(size=(1000, 3))
+    y = X @ [1.0, 2.0, 3.0] + rng.normal(size=1000) + 1000
+    return X, y
+
+
+@pytest.fixture
+def regressor(data):
+    X, y = data
+    return LinearRegression().fit(X[:500], y[:500])
+
+
+class TestMetricRegistry:
+    @pytest.mark.parametrize("chunk_size", [1000, 7])
+    def test_matches_scikit_learn(self, data, regressor, chunk_size):
+        X, y = data
+        y_pred = regressor.predict(X)
+
+        results = MetricRegistry(METRICS).evaluate(
+            regressor, row_chunks(X, y, chunk_size)
+        )
+        expected = {
+            metric.__name__: metric(y, y_pred)
+            for metric in [
+                r2_score,
+                explained_variance_score,
+                mean_squared_error,
+                mean_absolute_error,
+                max_error,
+            ]
+        }
+        assert list(results) == list(expected)
+        np.testing.assert_allclose(list(results.values()), list(expected.values()))
+
+    def test_constant_targets(self, data, regressor):
+        X, _ = data
+        y = regressor.predict(X)
+
+        results = MetricRegistry(METRICS[:2]).evaluate(regressor, [(X[:1], y[:1])])
+        assert results == {"r2_score": 1.0, "explained_variance_score": 1.0}
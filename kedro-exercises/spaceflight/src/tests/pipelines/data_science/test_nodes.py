@@ -0,0 +1,71 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.model_selection import train_test_split
+
+from kedro_tutorial.pipelines.data_science.nodes import FEATURES, split_data
+
+
+@pytest.fixture
+def master_table():
+    rng = np.random.RandomState(0)
+    return pd.DataFrame(
+        {
+            "engines": rng.randint(1, 4, 100).astype(float),
+            "passenger_capacity": rng.randint(1, 10, 100),
+            "crew": rng.uniform(size=100),
+            "d_check_complete": rng.uniform(size=100) < 0.5,
+            "moon_clearance_complete": rng.uniform(size=100) < 0.5,
+            "price": rng.uniform(size=100) * 1000,
+        }
+    )
+
+
+class TestSplitData:
+    def test_matches_train_test_split(self, master_table):
+        parameters = {"test_size": 0.2, "random_state": 3}
+
+        split = split_data(master_table, parameters)
+        expected = train_test_split(
+            master_table[FEATURES].values.astype(float),
+            master_table["price"].values,
+            test_size=0.2,
+            random_state=3,
+        )
+        for actual, expected_array in zip(split, expected):
+            np.testing.assert_array_equal(actual, expected_array)
+
+    def test_returns_views_of_one_buffer(self, master_table):
+        X_train, X_test, _, _ = split_data(
+            master_table, {"test_size": 0.2, "random_state": 3}
+        )
+
+        assert X_train.base is X_test.base
+        assert X_train.flags.c_contiguous and X_test.flags.c_contiguous
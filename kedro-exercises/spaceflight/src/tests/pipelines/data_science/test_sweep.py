@@ -0,0 +1,75 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+import pytest
+
+from kedro_tutorial.pipelines.data_science.sweep import sweep_models
+
+METRICS = ["sklearn.metrics.r2_score", "sklearn.metrics.mean_squared_error"]
+
+
+@pytest.fixture
+def split():
+    rng = np.random.RandomState(0)
+    X = rng.normal(size=(200, 3))
+    y = X @ [1.0, 2.0, 3.0] + rng.normal(size=200)
+    return X[:150], X[150:], y[:150], y[150:]
+
+
+@pytest.fixture
+def sweep():
+    return {
+        "n_jobs": 1,
+        "rank_by": "mean_squared_error",
+        "greater_is_better": False,
+        "candidates": [
+            {"name": "linear", "model": "sklearn.linear_model.LinearRegression"},
+            {
+                "name": "ridge",
+                "model": "sklearn.linear_model.Ridge",
+                "grid": {"alpha": [0.1, 1000.0]},
+            },
+        ],
+    }
+
+
+class TestSweepModels:
+    def test_ranks_every_candidate(self, split, sweep):
+        table = sweep_models(*split, sweep, METRICS)
+
+        assert table["rank"].tolist() == [1, 2, 3]
+        assert table["test_mean_squared_error"].is_monotonic_increasing
+        assert table["params"].iloc[-1] == '{"alpha": 1000.0}'
+        assert set(table["candidate"]) == {"linear", "ridge"}
+
+    def test_parallel_matches_serial(self, split, sweep):
+        serial = sweep_models(*split, sweep, METRICS)
+        parallel = sweep_models(*split, {**sweep, "n_jobs": 2}, METRICS)
+
+        pd.testing.assert_frame_equal(parallel, serial)
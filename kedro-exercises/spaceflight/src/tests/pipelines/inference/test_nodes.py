@@ -0,0 +1,64 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+from kedro_tutorial.pipelines.inference.nodes import predict_prices
+
+
+def test_predict_prices(caplog):
+    rng = np.random.RandomState(0)
+    X = rng.uniform(size=(20, 5))
+    regressor = LinearRegression().fit(X, X @ [1.0, 2.0, 3.0, 4.0, 5.0])
+    shuttles = pd.DataFrame(
+        {
+            "id": np.arange(20),
+            "engines": X[:, 0],
+            "passenger_capacity": X[:, 1],
+            "crew": X[:, 2],
+            "d_check_complete": np.where(X[:, 3] > 0.5, "t", "f"),
+            "moon_clearance_complete": np.where(X[:, 4] > 0.5, "t", "f"),
+        }
+    )
+
+    shuttles.loc[3, "crew"] = np.nan
+
+    with caplog.at_level(logging.INFO):
+        predictions = pd.concat(
+            predict_prices(regressor, (shuttles[:12], shuttles[12:])),
+            ignore_index=True,
+        )
+    flags = (X[:, 3:] > 0.5).astype(float)
+    expected = regressor.predict(np.column_stack([X[:, :3], flags]))
+    assert predictions["id"].tolist() == list(range(20))
+    expected[3] = np.nan
+    np.testing.assert_allclose(predictions["price"], expected)
+    assert "Scored 20 shuttles" in caplog.text
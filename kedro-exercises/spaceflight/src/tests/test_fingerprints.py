@@ -0,0 +1,121 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pandas as pd
+import pytest
+from kedro.extras.datasets.pandas import CSVDataSet
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import SequentialRunner
+
+from kedro_tutorial import fingerprints
+from kedro_tutorial.fingerprints import NodeFingerprints
+
+
+def double(data):
+    return data * 2
+
+
+def identity(data):
+    return data
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    raw = CSVDataSet(str(tmp_path / "raw.csv"))
+    raw.save(pd.DataFrame({"a": [1, 2]}))
+    return DataCatalog(
+        {
+            "raw": raw,
+            "doubled": CSVDataSet(str(tmp_path / "doubled.csv")),
+            "params:factor": MemoryDataSet(2),
+            "doubled_factor": MemoryDataSet(),
+        }
+    )
+
+
+@pytest.fixture
+def pipeline():
+    return Pipeline(
+        [
+            node(double, "raw", "intermediate", name="doubling"),
+            node(identity, "intermediate", "doubled", name="copying"),
+        ]
+    )
+
+
+@pytest.fixture
+def fingerprints_filepath(tmp_path):
+    return str(tmp_path / "fingerprints.json")
+
+
+def run_and_record(pipeline, catalog, fingerprints_filepath):
+    node_fingerprints = NodeFingerprints(fingerprints_filepath)
+    fingerprints = node_fingerprints.compute(pipeline, catalog)
+    SequentialRunner().run(pipeline, catalog)
+    node_fingerprints.record(fingerprints, [node.name for node in pipeline.nodes])
+
+
+class TestNodeFingerprints:
+    def test_nothing_up_to_date_before_first_run(
+        self, pipeline, catalog, fingerprints_filepath
+    ):
+        assert not NodeFingerprints(fingerprints_filepath).up_to_date(pipeline, catalog)
+
+    def test_all_up_to_date_after_run(self, pipeline, catalog, fingerprints_filepath):
+        run_and_record(pipeline, catalog, fingerprints_filepath)
+
+        up_to_date = NodeFingerprints(fingerprints_filepath).up_to_date(
+            pipeline, catalog
+        )
+        assert [node.name for node in up_to_date] == ["doubling", "copying"]
+
+    def test_changed_input_is_not_up_to_date(
+        self, pipeline, catalog, fingerprints_filepath
+    ):
+        run_and_record(pipeline, catalog, fingerprints_filepath)
+        catalog.save("raw", pd.DataFrame({"a": [3, 4]}))
+
+        assert not NodeFingerprints(fingerprints_filepath).up_to_date(pipeline, catalog)
+
+    def test_changed_parameter_is_not_up_to_date(self, catalog, fingerprints_filepath):
+        pipeline = Pipeline([node(double, "params:factor", "doubled_factor")])
+        run_and_record(pipeline, catalog, fingerprints_filepath)
+        catalog.add("params:factor", MemoryDataSet(3), replace=True)
+
+        assert not NodeFingerprints(fingerprints_filepath).up_to_date(pipeline, catalog)
+
+    def test_reuses_recorded_file_hashes(
+        self, pipeline, catalog, fingerprints_filepath, tmp_path, mocker
+    ):
+        run_and_record(pipeline, catalog, fingerprints_filepath)
+        sha256 = mocker.spy(fingerprints, "_sha256")
+
+        NodeFingerprints(fingerprints_filepath).up_to_date(pipeline, catalog)
+
+        hashed = {str(call.args[0]) for call in sha256.call_args_list}
+        assert str(tmp_path / "raw.csv") not in hashed
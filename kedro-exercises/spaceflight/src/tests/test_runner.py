@@ -0,0 +1,234 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+
+import pandas as pd
+import pytest
+from kedro.extras.datasets.pandas import CSVDataSet
+from kedro.io import AbstractDataSet, DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+
+from kedro_tutorial.runner import FingerprintRunner, PrefetchRunner
+
+
+class RecordingDataSet(MemoryDataSet):
+    def __init__(self, data, events, loaded=None):
+        super().__init__(data)
+        self._events = events
+        self._loaded = loaded
+
+    def _load(self):
+        if self._loaded is not None:
+            self._loaded.set()
+        self._events.append("load")
+        return super()._load()
+
+
+class FailingDataSet(MemoryDataSet):
+    def _save(self, data):
+        raise ValueError("Failed to save")
+
+
+class SharedDataSet(AbstractDataSet):
+    def __init__(self, store, save_delay=0.0):
+        self._store = store
+        self._save_delay = save_delay
+
+    def _load(self):
+        return self._store["data"]
+
+    def _save(self, data):
+        time.sleep(self._save_delay)
+        self._store["data"] = data
+
+    def _describe(self):
+        return {"save_delay": self._save_delay}
+
+
+def add_one(data):
+    return data + 1
+
+
+@pytest.fixture
+def pipeline():
+    return Pipeline(
+        [
+            node(add_one, "first", "first_plus_one", name="first_node"),
+            node(add_one, "second", "second_plus_one", name="second_node"),
+            node(add_one, "second_plus_one", "second_plus_two", name="third_node"),
+        ]
+    )
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"a": range(1000)})
+
+
+def run(runner, pipeline, catalog):
+    runner.run(pipeline, catalog)
+    return {name: catalog.load(name) for name in ("first_plus_one", "second_plus_two")}
+
+
+class TestPrefetchRunner:
+    def test_matches_sequential_run(self, pipeline, data):
+        def catalog():
+            return DataCatalog(
+                {
+                    "first": MemoryDataSet(data),
+                    "second": MemoryDataSet(data * 2),
+                    "first_plus_one": MemoryDataSet(),
+                    "second_plus_two": MemoryDataSet(),
+                }
+            )
+
+        expected = run(PrefetchRunner(), pipeline, catalog())
+        result = run(PrefetchRunner(is_async=True), pipeline, catalog())
+
+        assert expected.keys() == result.keys()
+        for name, value in expected.items():
+            pd.testing.assert_frame_equal(result[name], value)
+
+    def test_prefetches_inputs_of_next_nodes(self, pipeline, data):
+        events = []
+        second_loaded = threading.Event()
+
+        def wait_for_second(data):
+            events.append("wait" if second_loaded.wait(timeout=10) else "timeout")
+            return data
+
+        catalog = DataCatalog(
+            {
+                "first": MemoryDataSet(data),
+                "second": RecordingDataSet(data, events, second_loaded),
+            }
+        )
+        pipeline = Pipeline(
+            [
+                node(wait_for_second, "first", "first_plus_one", name="first_node"),
+                node(add_one, "second", "second_plus_one", name="second_node"),
+            ]
+        )
+
+        PrefetchRunner(is_async=True).run(pipeline, catalog)
+
+        assert events == ["load", "wait"]
+
+    def test_memory_budget_stops_prefetching(self, pipeline, data):
+        events = []
+
+        def record(data):
+            events.append("run")
+            return data
+
+        catalog = DataCatalog(
+            {
+                "first": RecordingDataSet(data, events),
+                "second": RecordingDataSet(data, events),
+            }
+        )
+        pipeline = Pipeline(
+            [
+                node(record, "first", "first_plus_one", name="first_node"),
+                node(record, "second", "second_plus_one", name="second_node"),
+            ]
+        )
+
+        PrefetchRunner(is_async=True, prefetch_memory=0).run(pipeline, catalog)
+
+        assert events == ["load", "run", "load", "run"]
+
+    def test_waits_for_transcoded_save(self, data):
+        store = {}
+        catalog = DataCatalog(
+            {
+                "first": MemoryDataSet(data),
+                "table@pandas": SharedDataSet(store, save_delay=0.1),
+                "table@raw": SharedDataSet(store),
+                "table_plus_one": MemoryDataSet(),
+            }
+        )
+        pipeline = Pipeline(
+            [
+                node(add_one, "first", "table@pandas", name="first_node"),
+                node(add_one, "table@raw", "table_plus_one", name="second_node"),
+            ]
+        )
+
+        PrefetchRunner(is_async=True).run(pipeline, catalog)
+
+        pd.testing.assert_frame_equal(catalog.load("table_plus_one"), data + 2)
+
+    def test_raises_failed_save(self, pipeline, data):
+        catalog = DataCatalog(
+            {
+                "first": MemoryDataSet(data),
+                "second": MemoryDataSet(data),
+                "second_plus_one": FailingDataSet(),
+            }
+        )
+
+        with pytest.raises(Exception, match="Failed to save"):
+            PrefetchRunner(is_async=True).run(pipeline, catalog)
+
+
+class TestFingerprintRunner:
+    def test_skips_nodes_of_unchanged_rerun(self, tmp_path, data):
+        calls = []
+
+        def record(data):
+            calls.append(len(data))
+            return data
+
+        first = CSVDataSet(str(tmp_path / "first.csv"))
+        first.save(data)
+        catalog = DataCatalog(
+            {
+                "first": first,
+                "copy": CSVDataSet(str(tmp_path / "copy.csv")),
+                "second_copy": CSVDataSet(str(tmp_path / "second_copy.csv")),
+            }
+        )
+        pipeline = Pipeline(
+            [
+                node(record, "first", "copy", name="copying"),
+                node(record, "copy", "second_copy", name="copying_again"),
+            ]
+        )
+        runner = FingerprintRunner(
+            fingerprints_filepath=str(tmp_path / "fingerprints.json")
+        )
+
+        runner.run(pipeline, catalog)
+        runner.run(pipeline, catalog)
+        assert calls == [len(data)] * 2
+
+        first.save(data[:10])
+        runner.run(pipeline, catalog)
+        assert calls == [len(data)] * 2 + [10] * 2
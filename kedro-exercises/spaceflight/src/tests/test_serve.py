@@ -0,0 +1,170 @@
+# Copyright 2020 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited ("QuantumBlack") name and logo
+# (either separately or in combination, "QuantumBlack Trademarks") are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from kedro_tutorial.serve import MicroBatcher, make_server
+
+
+def shuttle(crew):
+    return {
+        "engines": 1.0,
+        "passenger_capacity": 2,
+        "crew": crew,
+        "d_check_complete": "t",
+        "moon_clearance_complete": "f",
+    }
+
+
+@pytest.fixture
+def server():
+    X = np.eye(5)
+    regressor = LinearRegression(fit_intercept=False).fit(X, [1.0, 2.0, 3.0, 4.0, 5.0])
+    server = make_server(regressor, ("127.0.0.1", 0), max_wait=0.01)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def post(server, path, body):
+    url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+    request = Request(url, data=json.dumps(body).encode(), method="POST")
+    with urlopen(request) as response:
+        return json.loads(response.read())
+
+
+class TestScoringServer:
+    def test_predicts_concurrent_requests(self, server):
+        with ThreadPoolExecutor(8) as executor:
+            prices = list(
+                executor.map(
+                    lambda crew: post(server, "/predict", [shuttle(crew)]), range(16)
+                )
+            )
+
+        assert prices == [[1.0 + 2 * 2 + 3 * crew + 4] for crew in range(16)]
+
+    def test_missing_features_have_no_price(self, server):
+        assert post(server, "/predict", [shuttle(None), shuttle(1.0)]) == [None, 12.0]
+
+    def test_rejects_only_malformed_requests(self, server):
+        def predict(body):
+            try:
+                return post(server, "/predict", body)
+            except HTTPError as error:
+                return error.code
+
+        bodies = [
+            [shuttle(1.0)],
+            [{"crew": 1.0}],
+            [shuttle("many")],
+            [shuttle(2.0)],
+        ]
+        with ThreadPoolExecutor(4) as executor:
+            assert list(executor.map(predict, bodies)) == [[12.0], 400, 400, [15.0]]
+
+    def test_requires_content_length(self, server):
+        connection = HTTPConnection("127.0.0.1", server.server_address[1])
+        connection.putrequest("POST", "/predict")
+        connection.endheaders()
+
+        assert connection.getresponse().status == 411
+        connection.close()
+
+    def test_reports_scoring_failures(self, server, mocker):
+        mocker.patch.object(
+            server.batcher, "submit", side_effect=TypeError("Failed to score")
+        )
+
+        with pytest.raises(HTTPError) as error:
+            post(server, "/predict", [shuttle(1.0)])
+        assert error.value.code == 500
+        assert json.loads(error.value.read()) == {"error": "Failed to score"}
+
+    def test_exposes_latency(self, server):
+        post(server, "/predict", [shuttle(1.0)])
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urlopen(url) as response:
+            metrics = json.loads(response.read())
+
+        assert metrics["requests"] == 1
+        assert metrics["rows"] == 1
+        assert 0 < metrics["latency_ms"]["p50"] <= metrics["latency_ms"]["p99"]
+
+
+class TestMicroBatcher:
+    def test_batches_concurrent_requests(self):
+        batch_sizes = []
+
+        def score(shuttles):
+            batch_sizes.append(len(shuttles))
+            return shuttles["x"].to_numpy() * 2
+
+        batcher = MicroBatcher(score, max_batch_size=100, max_wait=0.05)
+        with ThreadPoolExecutor(4) as executor:
+            results = list(
+                executor.map(
+                    lambda x: batcher.submit(pd.DataFrame({"x": [x, x]})), range(4)
+                )
+            )
+
+        assert [result.tolist() for result in results] == [
+            [2 * x] * 2 for x in range(4)
+        ]
+        assert len(batch_sizes) < 4
+
+    def test_scores_the_other_requests_of_a_failing_batch(self):
+        def score(shuttles):
+            if (shuttles["x"] < 0).any():
+                raise ValueError("Negative x")
+            return shuttles["x"].to_numpy()
+
+        batcher = MicroBatcher(score, max_wait=0.05)
+        with ThreadPoolExecutor(2) as executor:
+            valid = executor.submit(batcher.submit, pd.DataFrame({"x": [1, 2]}))
+            invalid = executor.submit(batcher.submit, pd.DataFrame({"x": [-3]}))
+
+            assert valid.result().tolist() == [1, 2]
+            with pytest.raises(ValueError, match="Negative x"):
+                invalid.result()
+
+    def test_propagates_errors(self):
+        batcher = MicroBatcher(lambda shuttles: shuttles["missing"], max_wait=0)
+
+        with pytest.raises(KeyError):
+            batcher.submit(pd.DataFrame({"x": [1]}))